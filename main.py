@@ -15,12 +15,14 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QIcon
 
-from prompt_studio.ui.main_window import MainWindow
-from prompt_studio.models.database import DatabaseManager
-from prompt_studio.utils.csv_import import CSVImporter
+# Qt/asyncio integration ships with PySide6 >= 6.6
+try:
+    from PySide6 import QtAsyncio
+except ImportError:
+    QtAsyncio = None
 
 
 def setup_application():
@@ -38,43 +40,74 @@ def setup_application():
     
     # Set application style (optional - can be overridden by settings)
     app.setStyle("Fusion")
-    
+
+    # Run asyncio on the Qt event loop so LLM calls can share the GUI loop
+    # (and its persistent HTTP clients) instead of paying per-call loop setup
+    if QtAsyncio is not None:
+        asyncio.set_event_loop_policy(QtAsyncio.QAsyncioEventLoopPolicy())
+
     return app
 
 
-def import_initial_data():
-    """Import the initial CSV data if database is empty"""
-    try:
-        db_manager = DatabaseManager()
-        db_manager.create_tables()
-        
-        # Check if we have any prompts
-        with db_manager.get_session() as session:
-            from sqlmodel import select
-            from prompt_studio.models.database import Prompt
-            
-            existing_count = len(session.exec(select(Prompt)).all())
-            
+class InitialImportSignals(QObject):
+    """Signals for the background initial import"""
+    finished = Signal(dict)
+
+
+class InitialImportRunnable(QRunnable):
+    """Imports the initial CSV data off the UI thread if database is empty"""
+
+    def __init__(self, db_manager: "DatabaseManager", assets_file: Path):
+        super().__init__()
+        self.db_manager = db_manager
+        self.assets_file = assets_file
+        self.signals = InitialImportSignals()
+
+    def run(self):
+        try:
+            # Check if we have any prompts (COUNT only, no row hydration)
+            with self.db_manager.get_session() as session:
+                from sqlalchemy import func
+                from sqlmodel import select
+                from prompt_studio.models.database import Prompt
+
+                existing_count = session.exec(
+                    select(func.count()).select_from(Prompt)
+                ).one()
+
             if existing_count == 0:
-                # Import the assets CSV file
-                assets_file = project_root / "assets.csv"
-                if assets_file.exists():
-                    print(f"Importing initial prompts from {assets_file}...")
-                    importer = CSVImporter(db_manager)
-                    stats = importer.import_prompts(str(assets_file))
-                    
-                    print(f"Import completed: Created {stats['created']}, Errors: {stats['errors']}")
-                    
-                    if stats['errors'] > 0:
-                        print("Some errors occurred during import, but the application will continue.")
-                else:
-                    print("Assets CSV file not found, starting with empty database.")
+                print(f"Importing initial prompts from {self.assets_file}...")
+                from prompt_studio.utils.csv_import import CSVImporter
+                importer = CSVImporter(self.db_manager)
+                # Database is empty: take the executemany fast path
+                stats = importer.bulk_import(
+                    importer.iter_prompts(str(self.assets_file))
+                )
+
+                print(f"Import completed: Created {stats['created']}, Errors: {stats['errors']}")
+
+                if stats['errors'] > 0:
+                    print("Some errors occurred during import, but the application will continue.")
+
+                self.signals.finished.emit(stats)
             else:
                 print(f"Database already contains {existing_count} prompts.")
-                
-    except Exception as e:
-        print(f"Error during initial data import: {e}")
-        print("Application will continue with empty database.")
+
+        except Exception as e:
+            print(f"Error during initial data import: {e}")
+            print("Application will continue with empty database.")
+
+
+def start_initial_import(main_window):
+    """Kick off the initial CSV import in the global thread pool"""
+    assets_file = project_root / "assets.csv"
+    if not assets_file.exists():
+        print("Assets CSV file not found, starting with empty database.")
+        return
+
+    runnable = InitialImportRunnable(main_window.db_manager, assets_file)
+    runnable.signals.finished.connect(lambda stats: main_window.refresh_prompts())
+    QThreadPool.globalInstance().start(runnable)
 
 
 def main():
@@ -82,24 +115,54 @@ def main():
     try:
         # Setup QApplication
         app = setup_application()
-        
-        # Import initial data
-        import_initial_data()
-        
+
+        # Deferred until after QApplication exists so the heavy
+        # sqlmodel/httpx import chain doesn't delay first paint
+        from prompt_studio.ui.main_window import MainWindow
+
         # Create and show main window
         main_window = MainWindow()
         main_window.show()
+
+        # Import initial data in the background once the UI is up
+        start_initial_import(main_window)
         
+        # QtAsyncio.run() drives app.exec() internally but discards its
+        # return value, so programmatic exits record their status here
+        # before asking Qt to leave the loop
+        exit_status = {"code": 0}
+
+        def request_exit(code: int = 0):
+            exit_status["code"] = code
+            app.exit(code)
+
+        app.request_exit = request_exit
+
         # Handle application exit
         def handle_exit():
             print("Shutting down Prompt Studio...")
-            app.quit()
-        
+
+            # Close shared HTTP clients before quitting. Use a plain asyncio
+            # loop: the Qt loop is already winding down at this point
+            from prompt_studio.backends.llm_backends import backend_manager
+            try:
+                loop = asyncio.DefaultEventLoopPolicy().new_event_loop()
+                try:
+                    loop.run_until_complete(backend_manager.shutdown())
+                finally:
+                    loop.close()
+            except Exception as e:
+                print(f"Error during backend shutdown: {e}")
+
         app.aboutToQuit.connect(handle_exit)
-        
+
         # Start the event loop
         print("Starting Prompt Studio...")
-        exit_code = app.exec()
+        if QtAsyncio is not None:
+            QtAsyncio.run(keep_running=True)
+            exit_code = exit_status["code"]
+        else:
+            exit_code = app.exec()
         
         print("Prompt Studio closed.")
         return exit_code
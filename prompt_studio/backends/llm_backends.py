@@ -2,14 +2,143 @@
 LLM Backend connectors for Prompt Studio
 """
 import asyncio
-import json
+import atexit
+import hashlib
+import random
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from typing import AsyncIterator, List, Optional, Dict, Any
 import httpx
-import keyring
+import orjson
 from datetime import datetime
 import time
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Transient failures worth retrying instead of surfacing to the user
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5  # seconds
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Whether an exception is a transient HTTP failure"""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in RETRYABLE_STATUS_CODES
+    )
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Backoff delay: Retry-After when the server sends it, else full jitter"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return random.uniform(0, RETRY_BASE_DELAY * 2 ** attempt)
+
+
+async def with_retry(send, retries: int = RETRY_ATTEMPTS):
+    """Await send(), retrying transient failures with jittered backoff"""
+    for attempt in range(retries):
+        try:
+            return await send()
+        except Exception as e:
+            if attempt == retries - 1 or not _is_retryable(e):
+                raise
+            await asyncio.sleep(_retry_delay(e, attempt))
+
+
+# Keyring reads can mean a Secret Service / Keychain round-trip; cache
+# them in-process so repeated backend construction stays cheap
+_API_KEY_CACHE: Dict[tuple, tuple] = {}  # (service, username) -> (key, fetched_at)
+_API_KEY_TTL = 60  # seconds
+
+
+def get_cached_password(service: str, username: str) -> Optional[str]:
+    """Read a secret from keyring with a short in-process TTL cache"""
+    now = time.monotonic()
+    cached = _API_KEY_CACHE.get((service, username))
+    if cached and now - cached[1] < _API_KEY_TTL:
+        return cached[0]
+    try:
+        import keyring  # deferred: importing a keyring backend is not free
+        value = keyring.get_password(service, username)
+    except Exception:
+        value = None
+    _API_KEY_CACHE[(service, username)] = (value, now)
+    return value
+
+
+def invalidate_api_key_cache():
+    """Drop cached keyring reads (call after the user updates keys)"""
+    _API_KEY_CACHE.clear()
+
+
+# Shared clients keyed by (base_url, api_key, timeout, http2) so several
+# OpenAI-compatible backends pointing at the same host share one pool
+_CLIENT_CACHE: Dict[tuple, httpx.AsyncClient] = {}
+
+
+def get_shared_client(
+    base_url: str,
+    api_key: Optional[str],
+    timeout: int,
+    http2: bool
+) -> httpx.AsyncClient:
+    """Get (or create) the shared client for a connection key"""
+    key = (base_url, api_key, timeout, http2)
+    client = _CLIENT_CACHE.get(key)
+    if client is None or client.is_closed:
+        headers = {
+            "Content-Type": "application/json"
+        }
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        client = _CLIENT_CACHE[key] = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            base_url=base_url,
+            http2=http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=30
+            )
+        )
+    return client
+
+
+async def close_shared_clients():
+    """Close every client in the shared pool"""
+    for client in list(_CLIENT_CACHE.values()):
+        if not client.is_closed:
+            await client.aclose()
+    _CLIENT_CACHE.clear()
+
+
+def _close_shared_clients_at_exit():
+    try:
+        asyncio.run(close_shared_clients())
+    except Exception:
+        pass
+
+
+atexit.register(_close_shared_clients_at_exit)
+
 
 class LLMBackend(ABC):
     """Abstract base class for LLM backends"""
@@ -39,6 +168,10 @@ class LLMBackend(ABC):
         """Complete a prompt and return response"""
         pass
 
+    async def aclose(self):
+        """Close any resources held by the backend"""
+        pass
+
 
 class OpenAIBackend(LLMBackend):
     """OpenAI-compatible backend (works with OpenAI, Azure OpenAI, etc.)"""
@@ -48,56 +181,45 @@ class OpenAIBackend(LLMBackend):
         base_url: str = "https://api.openai.com/v1",
         api_key: Optional[str] = None,
         default_model: str = "gpt-4o-mini",
-        timeout: int = 60
+        timeout: int = 60,
+        http2: bool = True
     ):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key or self._get_api_key()
         self.default_model = default_model
         self.timeout = timeout
-        self._client = None
+        self.http2 = http2
     
     @property
     def name(self) -> str:
         return "openai"
     
     def _get_api_key(self) -> Optional[str]:
-        """Get API key from keyring or environment"""
-        try:
-            return keyring.get_password("PromptStudio", "openai_api_key")
-        except Exception:
-            return None
+        """Get API key from the in-process keyring cache"""
+        return get_cached_password("PromptStudio", "openai_api_key")
     
     def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client with proper headers"""
-        headers = {
-            "Content-Type": "application/json"
-        }
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        
-        return httpx.AsyncClient(
-            headers=headers,
-            timeout=self.timeout,
-            base_url=self.base_url
+        """Get the pooled HTTP client for this (base_url, api_key) pair"""
+        return get_shared_client(
+            self.base_url,
+            self.api_key,
+            self.timeout,
+            self.http2 and HTTP2_AVAILABLE
         )
-    
+
     async def list_models(self) -> List[str]:
         """List available models"""
-        client = None
         try:
             client = self._get_client()
             response = await client.get("/models")
             response.raise_for_status()
-            
-            data = response.json()
+
+            data = orjson.loads(response.content)
             models = [model["id"] for model in data.get("data", [])]
             return sorted(models)
         except Exception as e:
             print(f"Error listing OpenAI models: {e}")
             return [self.default_model]
-        finally:
-            if client:
-                await client.aclose()
     
     async def complete(
         self,
@@ -110,49 +232,73 @@ class OpenAIBackend(LLMBackend):
         stream: bool = False
     ) -> AsyncIterator[str]:
         """Complete a prompt using OpenAI API"""
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
-        
+        messages = (
+            [{"role": "system", "content": system}] if system else []
+        ) + [{"role": "user", "content": prompt}]
+
         payload = {
             "model": model,
             "messages": messages,
-            "stream": stream
+            "stream": stream,
+            **({"temperature": temperature} if temperature is not None else {}),
+            **({"max_tokens": max_tokens} if max_tokens is not None else {})
         }
-        
-        if temperature is not None:
-            payload["temperature"] = temperature
-        if max_tokens is not None:
-            payload["max_tokens"] = max_tokens
-        
+
         client = self._get_client()
         
         try:
             if stream:
-                async with client.stream(
-                    "POST", "/chat/completions", json=payload
-                ) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data = line[6:]
-                            if data.strip() == "[DONE]":
-                                break
-                            try:
-                                chunk = json.loads(data)
-                                content = chunk["choices"][0]["delta"].get("content", "")
-                                if content:
-                                    yield content
-                            except (json.JSONDecodeError, KeyError):
-                                continue
+                # Retry only until the first token; replaying a partial
+                # stream would duplicate output
+                attempt = 0
+                yielded = False
+                while True:
+                    try:
+                        async with client.stream(
+                            "POST", "/chat/completions", content=orjson.dumps(payload)
+                        ) as response:
+                            response.raise_for_status()
+                            # Parse SSE frames at the byte level: one buffer,
+                            # no per-line str decode, orjson for the payloads
+                            buf = bytearray()
+                            async for chunk in response.aiter_bytes():
+                                buf += chunk
+                                while (nl := buf.find(b"\n")) != -1:
+                                    line = bytes(buf[:nl]).rstrip(b"\r")
+                                    del buf[:nl + 1]
+                                    if not line.startswith(b"data: "):
+                                        continue
+                                    data = line[6:]
+                                    if data == b"[DONE]":
+                                        return
+                                    try:
+                                        obj = orjson.loads(data)
+                                        content = obj["choices"][0]["delta"].get("content", "")
+                                    except (orjson.JSONDecodeError, KeyError, IndexError):
+                                        continue
+                                    if content:
+                                        yielded = True
+                                        yield content
+                        break
+                    except Exception as e:
+                        if (yielded or attempt >= RETRY_ATTEMPTS - 1
+                                or not _is_retryable(e)):
+                            raise
+                        await asyncio.sleep(_retry_delay(e, attempt))
+                        attempt += 1
             else:
-                response = await client.post("/chat/completions", json=payload)
-                response.raise_for_status()
-                data = response.json()
+                async def _send():
+                    response = await client.post(
+                        "/chat/completions", content=orjson.dumps(payload)
+                    )
+                    response.raise_for_status()
+                    return response
+
+                response = await with_retry(_send)
+                data = orjson.loads(response.content)
                 content = data["choices"][0]["message"]["content"]
                 yield content
-                
+
         except Exception as e:
             yield f"Error: {str(e)}"
 
@@ -161,12 +307,14 @@ class OllamaBackend(LLMBackend):
     """Ollama backend for local LLMs"""
     
     def __init__(
-        self, 
+        self,
         base_url: str = "http://localhost:11434",
-        timeout: int = 60
+        timeout: int = 60,
+        http2: bool = False  # local HTTP/1.1 server, no TLS handshake to save
     ):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.http2 = http2
         self._client = None
     
     @property
@@ -174,29 +322,38 @@ class OllamaBackend(LLMBackend):
         return "ollama"
     
     def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client"""
-        return httpx.AsyncClient(
-            timeout=self.timeout,
-            base_url=self.base_url
-        )
-    
+        """Get the shared HTTP client, creating it lazily"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                base_url=self.base_url,
+                http2=self.http2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=100,
+                    max_connections=200,
+                    keepalive_expiry=30
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+
     async def list_models(self) -> List[str]:
         """List available Ollama models"""
-        client = None
         try:
             client = self._get_client()
             response = await client.get("/api/tags")
             response.raise_for_status()
-            
-            data = response.json()
+
+            data = orjson.loads(response.content)
             models = [model["name"] for model in data.get("models", [])]
             return sorted(models)
         except Exception as e:
             print(f"Error listing Ollama models: {e}")
             return []
-        finally:
-            if client:
-                await client.aclose()
     
     async def complete(
         self,
@@ -209,46 +366,75 @@ class OllamaBackend(LLMBackend):
         stream: bool = False
     ) -> AsyncIterator[str]:
         """Complete a prompt using Ollama API"""
+        options = {
+            key: value
+            for key, value in (
+                ("temperature", temperature),
+                ("num_predict", max_tokens)
+            )
+            if value is not None
+        }
         payload = {
             "model": model,
             "prompt": prompt,
-            "stream": stream
+            "stream": stream,
+            **({"system": system} if system else {}),
+            **({"options": options} if options else {})
         }
-        
-        if system:
-            payload["system"] = system
-        if temperature is not None:
-            payload["options"] = payload.get("options", {})
-            payload["options"]["temperature"] = temperature
-        if max_tokens is not None:
-            payload["options"] = payload.get("options", {})
-            payload["options"]["num_predict"] = max_tokens
-        
+
         client = self._get_client()
         
         try:
             if stream:
-                async with client.stream(
-                    "POST", "/api/generate", json=payload
-                ) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        try:
-                            chunk = json.loads(line)
-                            content = chunk.get("response", "")
-                            if content:
-                                yield content
-                            if chunk.get("done", False):
-                                break
-                        except json.JSONDecodeError:
-                            continue
+                # Retry only until the first token; replaying a partial
+                # stream would duplicate output
+                attempt = 0
+                yielded = False
+                while True:
+                    try:
+                        async with client.stream(
+                            "POST", "/api/generate", content=orjson.dumps(payload)
+                        ) as response:
+                            response.raise_for_status()
+                            # NDJSON: byte-level buffering, no "data: " prefix
+                            buf = bytearray()
+                            async for chunk in response.aiter_bytes():
+                                buf += chunk
+                                while (nl := buf.find(b"\n")) != -1:
+                                    line = bytes(buf[:nl]).strip()
+                                    del buf[:nl + 1]
+                                    if not line:
+                                        continue
+                                    try:
+                                        obj = orjson.loads(line)
+                                    except orjson.JSONDecodeError:
+                                        continue
+                                    content = obj.get("response", "")
+                                    if content:
+                                        yielded = True
+                                        yield content
+                                    if obj.get("done", False):
+                                        return
+                        break
+                    except Exception as e:
+                        if (yielded or attempt >= RETRY_ATTEMPTS - 1
+                                or not _is_retryable(e)):
+                            raise
+                        await asyncio.sleep(_retry_delay(e, attempt))
+                        attempt += 1
             else:
-                response = await client.post("/api/generate", json=payload)
-                response.raise_for_status()
-                data = response.json()
+                async def _send():
+                    response = await client.post(
+                        "/api/generate", content=orjson.dumps(payload)
+                    )
+                    response.raise_for_status()
+                    return response
+
+                response = await with_retry(_send)
+                data = orjson.loads(response.content)
                 content = data.get("response", "")
                 yield content
-                
+
         except Exception as e:
             yield f"Error: {str(e)}"
 
@@ -264,7 +450,8 @@ class LMStudioBackend(OpenAIBackend):
         super().__init__(
             base_url=base_url,
             api_key="lm-studio",  # LM Studio uses dummy key
-            timeout=timeout
+            timeout=timeout,
+            http2=False  # local HTTP/1.1 server
         )
     
     @property
@@ -278,33 +465,107 @@ class LMStudioBackend(OpenAIBackend):
 
 class CustomHTTPBackend(LLMBackend):
     """Custom HTTP backend with user-defined payload template"""
-    
+
+    PLACEHOLDER_NAMES = ("prompt", "system", "temperature", "max_tokens")
+
     def __init__(
         self,
         base_url: str,
         payload_template: str,
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = 60
+        timeout: int = 60,
+        http2: bool = True
     ):
         self.base_url = base_url
         self.payload_template = payload_template
         self.headers = headers or {}
         self.timeout = timeout
+        self.http2 = http2
         self._client = None
+        # Parse the template once; complete() only substitutes slot values
+        self._tmpl, self._slots = self._compile_template()
+
+    def _compile_template(self):
+        """Parse the payload template and record placeholder slot paths
+
+        Returns (parsed_template, slots) where slots is a list of
+        (path, placeholder_name) tuples, or (None, []) when the template
+        is not valid JSON or embeds placeholders inside larger strings —
+        those cases fall back to string replacement per call.
+        """
+        sentinels = {"{%s}" % name: name for name in self.PLACEHOLDER_NAMES}
+        try:
+            tmpl = orjson.loads(self.payload_template)
+        except orjson.JSONDecodeError:
+            return None, []
+
+        slots = []
+        embedded = False
+
+        def walk(node, path):
+            nonlocal embedded
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    walk(value, path + (key,))
+            elif isinstance(node, list):
+                for i, value in enumerate(node):
+                    walk(value, path + (i,))
+            elif isinstance(node, str):
+                if node in sentinels:
+                    slots.append((path, sentinels[node]))
+                elif any(sentinel in node for sentinel in sentinels):
+                    embedded = True
+
+        walk(tmpl, ())
+
+        if embedded or not isinstance(tmpl, (dict, list)):
+            return None, []
+        return tmpl, slots
+
+    def _build_payload(self, values: Dict[str, Any]) -> Any:
+        """Build a request payload by filling slots in the parsed template
+
+        Only the containers along slot paths are copied; untouched
+        subtrees are shared with the template.
+        """
+        payload = dict(self._tmpl) if isinstance(self._tmpl, dict) else list(self._tmpl)
+        for path, name in self._slots:
+            value = values.get(name)
+            if value is None:
+                continue  # leave the sentinel in place, as string replace did
+            node = payload
+            for key in path[:-1]:
+                child = node[key]
+                child = dict(child) if isinstance(child, dict) else list(child)
+                node[key] = child
+                node = child
+            node[path[-1]] = value
+        return payload
     
     @property
     def name(self) -> str:
         return "custom"
     
     def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client"""
-        if not self._client:
+        """Get the shared HTTP client, creating it lazily"""
+        if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                http2=self.http2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=100,
+                    max_connections=200,
+                    keepalive_expiry=30
+                )
             )
         return self._client
-    
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+
     async def list_models(self) -> List[str]:
         """Custom backends don't have model listing"""
         return ["default"]
@@ -321,23 +582,38 @@ class CustomHTTPBackend(LLMBackend):
     ) -> AsyncIterator[str]:
         """Complete using custom HTTP endpoint"""
         try:
-            # Replace placeholders in payload template
-            payload_str = self.payload_template.replace("{prompt}", prompt)
-            if system:
-                payload_str = payload_str.replace("{system}", system)
-            if temperature is not None:
-                payload_str = payload_str.replace("{temperature}", str(temperature))
-            if max_tokens is not None:
-                payload_str = payload_str.replace("{max_tokens}", str(max_tokens))
-            
-            payload = json.loads(payload_str)
+            if self._tmpl is not None:
+                payload = self._build_payload({
+                    "prompt": prompt,
+                    "system": system,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                })
+            else:
+                # Fallback: replace placeholders in the raw template text
+                payload_str = self.payload_template.replace("{prompt}", prompt)
+                if system:
+                    payload_str = payload_str.replace("{system}", system)
+                if temperature is not None:
+                    payload_str = payload_str.replace("{temperature}", str(temperature))
+                if max_tokens is not None:
+                    payload_str = payload_str.replace("{max_tokens}", str(max_tokens))
+
+                payload = orjson.loads(payload_str)
             
             client = self._get_client()
-            response = await client.post(self.base_url, json=payload)
-            response.raise_for_status()
-            
+
+            async def _send():
+                response = await client.post(
+                    self.base_url, content=orjson.dumps(payload)
+                )
+                response.raise_for_status()
+                return response
+
+            response = await with_retry(_send)
+
             # Try to extract text from response
-            data = response.json()
+            data = orjson.loads(response.content)
             content = str(data)  # Basic fallback
             
             # Try common response formats
@@ -353,30 +629,262 @@ class CustomHTTPBackend(LLMBackend):
             yield f"Error: {str(e)}"
 
 
+class CompletionCache:
+    """Two-tier in-process cache for complete() results
+
+    The exact tier hashes the full request key (backend, model, system,
+    prompt, temperature) and answers in microseconds, LRU-bounded. The
+    optional semantic tier embeds prompts locally and returns a cached
+    response when cosine similarity clears the threshold; it is off by
+    default since it adds embedding cost and needs sentence-transformers.
+    """
+
+    MAX_ENTRIES = 1000
+    SIMILARITY_THRESHOLD = 0.95
+
+    def __init__(self, semantic: bool = False):
+        self._exact: OrderedDict = OrderedDict()
+        self.semantic = semantic
+        self._embedder = None
+        self._embeddings: List[tuple] = []  # (vector, response)
+
+    @staticmethod
+    def _hash_key(key_parts: tuple) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        for part in key_parts:
+            h.update(str(part).encode())
+            h.update(b"\x00")
+        return h.digest()
+
+    def get(self, key_parts: tuple) -> Optional[str]:
+        """Look up a cached response: exact hash first, then semantic"""
+        key = self._hash_key(key_parts)
+        if key in self._exact:
+            self._exact.move_to_end(key)
+            return self._exact[key]
+        if self.semantic:
+            return self._semantic_lookup(key_parts[3])
+        return None
+
+    def put(self, key_parts: tuple, response: str):
+        """Store a completed response in both tiers"""
+        key = self._hash_key(key_parts)
+        self._exact[key] = response
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.MAX_ENTRIES:
+            self._exact.popitem(last=False)
+
+        if self.semantic:
+            vector = self._embed(key_parts[3])
+            if vector is not None:
+                self._embeddings.append((vector, response))
+
+    def _get_embedder(self):
+        """Lazily load the local embedding model; disable tier on failure"""
+        if self._embedder is None and self.semantic:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._embedder = SentenceTransformer("all-MiniLM-L6-v2")
+            except Exception as e:
+                print(f"Semantic cache disabled (no embedding model): {e}")
+                self.semantic = False
+        return self._embedder
+
+    def _embed(self, text: str):
+        embedder = self._get_embedder()
+        if embedder is None:
+            return None
+        return embedder.encode(text, normalize_embeddings=True)
+
+    def _semantic_lookup(self, prompt: str) -> Optional[str]:
+        vector = self._embed(prompt)
+        if vector is None or not self._embeddings:
+            return None
+        best_score, best_response = 0.0, None
+        for cached_vector, response in self._embeddings:
+            score = float(vector @ cached_vector)
+            if score > best_score:
+                best_score, best_response = score, response
+        if best_score >= self.SIMILARITY_THRESHOLD:
+            return best_response
+        return None
+
+
+class AIMDRateLimiter:
+    """Concurrency gate + sliding-window rate limiter for one backend
+
+    Caps in-flight requests and paces request starts to a requests-per-minute
+    budget. Observed 429s halve the concurrency cap (multiplicative decrease);
+    a run of successes adds slots back one at a time (additive increase).
+    """
+
+    INCREASE_AFTER = 20  # successes needed before adding a slot back
+
+    def __init__(self, rpm: int = 60, max_concurrency: int = 10):
+        self.rpm = rpm
+        self.max_concurrency = max_concurrency
+        self._limit = max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._starts = deque()  # monotonic start times in the current window
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        """Wait for a free slot and for room in the per-minute budget"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+        while True:
+            now = time.monotonic()
+            while self._starts and now - self._starts[0] >= 60:
+                self._starts.popleft()
+            if len(self._starts) < self.rpm:
+                self._starts.append(now)
+                return
+            await asyncio.sleep(self._starts[0] + 60 - now)
+
+    async def release(self, rate_limited: bool = False):
+        """Release a slot and apply the AIMD adjustment"""
+        async with self._cond:
+            self._active -= 1
+            if rate_limited:
+                self._limit = max(1, self._limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if (self._successes >= self.INCREASE_AFTER
+                        and self._limit < self.max_concurrency):
+                    self._limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
 class BackendManager:
     """Manages multiple LLM backends"""
-    
+
+    # (requests per minute, max concurrent requests) per backend
+    PROVIDER_PROFILES = {
+        "openai": (60, 10),
+        "ollama": (1000, 2),
+        "lmstudio": (1000, 2),
+        "custom": (120, 5),
+    }
+
     def __init__(self):
         self.backends: Dict[str, LLMBackend] = {}
+        self._limiters: Dict[str, AIMDRateLimiter] = {}
+        # Semantic tier stays off unless enabled from settings
+        self._cache = CompletionCache(semantic=False)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
         self._setup_default_backends()
-    
+
+    def background_loop(self) -> asyncio.AbstractEventLoop:
+        """Shared long-lived event loop for off-UI-thread async calls
+
+        Started lazily on first use and reused for the process lifetime, so
+        callers schedule coroutines with asyncio.run_coroutine_threadsafe
+        instead of paying loop setup/teardown per call.
+        """
+        if self._loop is None or self._loop.is_closed():
+            # Sidestep the installed policy: under QtAsyncio the policy's
+            # new_event_loop() hands back a Qt-bound loop that only runs on
+            # the main thread, which would kill this worker thread
+            self._loop = asyncio.DefaultEventLoopPolicy().new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="backend-loop",
+                daemon=True
+            )
+            self._loop_thread.start()
+        return self._loop
+
     def _setup_default_backends(self):
         """Setup default backends"""
         self.backends["openai"] = OpenAIBackend()
         self.backends["ollama"] = OllamaBackend()
         self.backends["lmstudio"] = LMStudioBackend()
-    
+        for name in self.backends:
+            self._limiters[name] = self._make_limiter(name)
+
+    def _make_limiter(self, name: str) -> AIMDRateLimiter:
+        """Create a rate limiter seeded from the provider profile"""
+        rpm, max_concurrency = self.PROVIDER_PROFILES.get(
+            name, self.PROVIDER_PROFILES["custom"]
+        )
+        return AIMDRateLimiter(rpm=rpm, max_concurrency=max_concurrency)
+
     def get_backend(self, name: str) -> Optional[LLMBackend]:
         """Get backend by name"""
         return self.backends.get(name)
-    
+
     def add_backend(self, backend: LLMBackend):
         """Add a custom backend"""
         self.backends[backend.name] = backend
+        self._limiters[backend.name] = self._make_limiter(backend.name)
+
+    async def complete(self, name: str, **kwargs) -> AsyncIterator[str]:
+        """Run a completion through the cache and concurrency/rate gate"""
+        backend = self.get_backend(name)
+        if not backend:
+            yield f"Error: Backend {name} not found"
+            return
+
+        cache_key = (
+            name,
+            kwargs.get("model", ""),
+            kwargs.get("system"),
+            kwargs.get("prompt", ""),
+            kwargs.get("temperature"),
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = self._limiters[name] = self._make_limiter(name)
+
+        await limiter.acquire()
+        rate_limited = False
+        failed = False
+        parts = []
+        try:
+            async for chunk in backend.complete(**kwargs):
+                if chunk.startswith("Error:"):
+                    failed = True
+                    if "429" in chunk:
+                        rate_limited = True
+                parts.append(chunk)
+                yield chunk
+        finally:
+            await limiter.release(rate_limited)
+
+        if not failed and parts:
+            self._cache.put(cache_key, "".join(parts))
     
     def list_backends(self) -> List[str]:
         """List all available backends"""
         return list(self.backends.keys())
+
+    async def shutdown(self):
+        """Close the HTTP clients of all backends"""
+        for backend in self.backends.values():
+            try:
+                await backend.aclose()
+            except Exception as e:
+                print(f"Error closing backend {backend.name}: {e}")
+        await close_shared_clients()
+
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread is not None:
+                self._loop_thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
     
     async def test_backend(self, name: str, test_prompt: str = "Hello") -> Dict[str, Any]:
         """Test a backend with a simple prompt"""
@@ -393,7 +901,8 @@ class BackendManager:
             model = models[0]
             response_parts = []
             
-            async for chunk in backend.complete(
+            async for chunk in self.complete(
+                name,
                 prompt=test_prompt,
                 model=model,
                 stream=False
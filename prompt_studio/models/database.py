@@ -1,20 +1,66 @@
 """
 Database models for Prompt Studio
 """
+import asyncio
 from datetime import datetime
 from typing import Optional, List
 import uuid
-import json
 
+import orjson
 from sqlmodel import SQLModel, Field, Relationship, Session, create_engine, select
-from sqlalchemy import Text, JSON, Column
+from sqlalchemy import (
+    Text, JSON, Column, DateTime, ForeignKey, Index, LargeBinary, String,
+    event, func
+)
+from sqlalchemy.types import TypeDecorator
+
+
+class UUIDBlob(TypeDecorator):
+    """Store UUIDs as 16-byte blobs while exposing them as str
+
+    Halves index entry size versus 36-char text keys and turns key
+    comparisons (including the History -> Prompt join) into a 16-byte
+    memcmp.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            return value
+        return uuid.UUID(str(value)).bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Row predates the blob migration (read before create_tables
+            # has run): pass the 36-char text id through unchanged
+            return value
+        return str(uuid.UUID(bytes=value))
+
+
+class BackendKind(SQLModel, table=True):
+    """Lookup table mapping backend names to small integer ids"""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(unique=True, index=True)
+
+
+# Seeded ids are stable, so name<->id maps can live in-process instead of
+# paying a lookup-table join per History row
+BACKEND_KIND_IDS = {"openai": 1, "ollama": 2, "lmstudio": 3, "custom": 4}
+BACKEND_KIND_NAMES = {kind_id: name for name, kind_id in BACKEND_KIND_IDS.items()}
 
 
 class PromptTagLink(SQLModel, table=True):
     """Many-to-many relationship between prompts and tags"""
     __tablename__ = "prompt_tag"
-    
-    prompt_id: str = Field(foreign_key="prompt.id", primary_key=True)
+
+    prompt_id: str = Field(
+        sa_column=Column(UUIDBlob, ForeignKey("prompt.id"), primary_key=True)
+    )
     tag_id: int = Field(foreign_key="tag.id", primary_key=True)
 
 
@@ -32,15 +78,38 @@ class Tag(SQLModel, table=True):
 
 class Prompt(SQLModel, table=True):
     """Main prompt model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    __table_args__ = (
+        # Covers the "favorites in category" view with one index range scan
+        Index("ix_prompt_favorite_category", "is_favorite", "category"),
+    )
+
+    id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(UUIDBlob, primary_key=True)
+    )
     name: str = Field(unique=True, index=True)
     content: str
     description: Optional[str] = Field(default=None)
-    category: Optional[str] = Field(default=None, index=True)
-    placeholders_schema: Optional[str] = Field(default=None)  # JSON string
+    category: Optional[str] = Field(
+        default=None,
+        # NOCASE makes category equality case-insensitive without LIKE
+        sa_column=Column(String(64, collation="NOCASE"), index=True)
+    )
+    placeholders_schema: Optional[list] = Field(default=None, sa_column=Column(JSON))
     is_favorite: bool = Field(default=False, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.current_timestamp(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime,
+            server_default=func.current_timestamp(),
+            onupdate=func.current_timestamp(),
+            nullable=False
+        )
+    )
     
     # Relationships
     tags: List[Tag] = Relationship(
@@ -51,61 +120,102 @@ class Prompt(SQLModel, table=True):
     
     def get_placeholders_schema(self) -> List[dict]:
         """Get placeholders schema as Python list"""
-        if self.placeholders_schema:
-            try:
-                return json.loads(self.placeholders_schema)
-            except json.JSONDecodeError:
-                return []
-        return []
-    
+        return self.placeholders_schema or []
+
     def set_placeholders_schema(self, schema: List[dict]):
         """Set placeholders schema from Python list"""
-        self.placeholders_schema = json.dumps(schema) if schema else None
+        self.placeholders_schema = schema if schema else None
 
 
 class History(SQLModel, table=True):
     """History of prompt executions"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
-    prompt_id: Optional[str] = Field(default=None, foreign_key="prompt.id", index=True)
-    backend: str = Field(index=True)  # openai|ollama|lmstudio|custom
-    request_payload: str  # JSON string
+    __table_args__ = (
+        # Composite indexes for the "latest N runs" query paths
+        Index("ix_history_prompt_created", "prompt_id", "created_at"),
+        Index("ix_history_backend_created", "backend", "created_at"),
+    )
+
+    id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(UUIDBlob, primary_key=True)
+    )
+    prompt_id: Optional[str] = Field(
+        default=None,
+        sa_column=Column(UUIDBlob, ForeignKey("prompt.id"), index=True)
+    )
+    backend: int = Field(foreign_key="backendkind.id", index=True)
+    request_payload: dict = Field(sa_column=Column(JSON))
     response_text: str
     duration_ms: int
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime,
+            server_default=func.current_timestamp(),
+            nullable=False,
+            index=True
+        )
+    )
     
     # Relationships
     prompt: Optional[Prompt] = Relationship(back_populates="history_entries")
     
+    @property
+    def backend_name(self) -> str:
+        """Backend name for the stored backend kind id"""
+        backend = self.backend
+        if isinstance(backend, str):
+            # Legacy column keeps its TEXT affinity, so even migrated
+            # kind ids read back as digit strings; rows seen before the
+            # migration still hold the name itself
+            if backend.isdigit():
+                return BACKEND_KIND_NAMES.get(int(backend), "custom")
+            return backend
+        return BACKEND_KIND_NAMES.get(backend, "custom")
+
+    @staticmethod
+    def backend_id_for(name: str) -> int:
+        """Backend kind id for a backend name"""
+        return BACKEND_KIND_IDS.get(name, BACKEND_KIND_IDS["custom"])
+
     def get_request_payload(self) -> dict:
         """Get request payload as Python dict"""
-        try:
-            return json.loads(self.request_payload)
-        except json.JSONDecodeError:
-            return {}
-    
+        return self.request_payload or {}
+
     def set_request_payload(self, payload: dict):
         """Set request payload from Python dict"""
-        self.request_payload = json.dumps(payload)
+        self.request_payload = payload
 
 
 class Workflow(SQLModel, table=True):
     """Workflow model for storing prompt workflows"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(UUIDBlob, primary_key=True)
+    )
     name: str = Field(index=True)
-    graph_json: str  # JSON string
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-    
+    graph_json: dict = Field(sa_column=Column(JSON))
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.current_timestamp(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime,
+            server_default=func.current_timestamp(),
+            onupdate=func.current_timestamp(),
+            nullable=False
+        )
+    )
+
     def get_graph(self) -> dict:
         """Get graph as Python dict"""
-        try:
-            return json.loads(self.graph_json)
-        except json.JSONDecodeError:
-            return {}
-    
+        return self.graph_json or {}
+
     def set_graph(self, graph: dict):
         """Set graph from Python dict"""
-        self.graph_json = json.dumps(graph)
+        self.graph_json = graph
 
 
 class Settings(SQLModel, table=True):
@@ -120,24 +230,194 @@ class Settings(SQLModel, table=True):
     proxy_url: Optional[str] = Field(default=None)
 
 
+class HistoryWriter:
+    """Write-behind queue for History rows
+
+    Accumulates rows from completed runs and flushes them in batches with
+    bulk_insert_mappings, so a burst of runs (e.g. a workflow) pays one
+    commit per batch instead of one fsync per row.
+    """
+
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL = 0.5  # seconds to wait for a batch to fill
+
+    def __init__(self, db_manager: "DatabaseManager"):
+        self.db_manager = db_manager
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def enqueue(self, history: History):
+        """Queue a History row for batched insertion"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        await self._queue.put(history)
+
+    async def _run(self):
+        """Pop rows until a batch fills or the flush interval elapses"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: List[History]):
+        """Insert a batch of rows with one commit"""
+        try:
+            mappings = []
+            for row in batch:
+                mapping = row.model_dump()
+                # An unset created_at must be absent, not None: bulk
+                # mappings bind present keys verbatim, and NULL violates
+                # the NOT NULL column whose server default only fills
+                # omitted values
+                if mapping.get("created_at") is None:
+                    del mapping["created_at"]
+                mappings.append(mapping)
+
+            with self.db_manager.get_session() as session:
+                session.bulk_insert_mappings(History, mappings)
+                session.commit()
+        except Exception as e:
+            print(f"Error writing history batch: {e}")
+
+    async def aclose(self):
+        """Stop the background task and flush anything still queued"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            self._flush(remaining)
+
+
 class DatabaseManager:
     """Database management class"""
     
     def __init__(self, db_url: str = "sqlite:///prompt_studio.db"):
-        self.engine = create_engine(db_url, echo=False)
-        
+        self.engine = create_engine(
+            db_url,
+            echo=False,
+            # orjson (de)serializes the JSON columns roughly 2-3x faster
+            # than the stdlib codec
+            json_serializer=lambda value: orjson.dumps(value).decode(),
+            json_deserializer=orjson.loads,
+        )
+
+        if db_url.startswith("sqlite"):
+            # WAL lets readers and the writer overlap; synchronous=NORMAL
+            # drops the per-commit fsync that FULL pays in WAL mode
+            @event.listens_for(self.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+
+        self.history_writer = HistoryWriter(self)
+
+    # UUID-keyed columns that older releases stored as 36-char text
+    _UUID_COLUMNS = (
+        ("prompt", "id"),
+        ("prompt_tag", "prompt_id"),
+        ("history", "id"),
+        ("history", "prompt_id"),
+        ("workflow", "id"),
+    )
+
     def create_tables(self):
         """Create all tables"""
         SQLModel.metadata.create_all(self.engine)
-        
-        # Create default settings if not exists
+
+        # create_all skips tables that already exist, so indexes added
+        # after a table first shipped (the composite History/Prompt ones)
+        # never materialize on upgraded databases; create them explicitly
+        for table in SQLModel.metadata.tables.values():
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+        if self.engine.dialect.name == "sqlite":
+            self._migrate_legacy_uuid_text()
+            self._migrate_legacy_backend_names()
+
+        # Create default settings and backend kinds if not exists
         with Session(self.engine) as session:
             settings = session.get(Settings, 1)
             if not settings:
                 settings = Settings(id=1)
                 session.add(settings)
-                session.commit()
-    
+
+            for name, kind_id in BACKEND_KIND_IDS.items():
+                if not session.get(BackendKind, kind_id):
+                    session.add(BackendKind(id=kind_id, name=name))
+
+            session.commit()
+
+    def _migrate_legacy_uuid_text(self):
+        """One-time rewrite of 36-char text uuid keys to 16-byte blobs
+
+        Databases created before UUIDBlob (including the bundled
+        prompt_studio.db) hold text ids that neither compare equal to
+        blob bind params nor decode on read. typeof() finds the legacy
+        rows, so a migrated database costs one index scan per column and
+        nothing is touched twice. Raw driver statements keyed on rowid
+        sidestep the type converters while rewriting.
+        """
+        try:
+            with self.engine.begin() as conn:
+                for table, column in self._UUID_COLUMNS:
+                    rows = conn.exec_driver_sql(
+                        f"SELECT rowid, {column} FROM {table} "
+                        f"WHERE typeof({column}) = 'text'"
+                    ).fetchall()
+                    for rowid, value in rows:
+                        conn.exec_driver_sql(
+                            f"UPDATE {table} SET {column} = ? WHERE rowid = ?",
+                            (uuid.UUID(value).bytes, rowid),
+                        )
+        except Exception as e:
+            print(f"Error migrating legacy uuid columns: {e}")
+
+    def _migrate_legacy_backend_names(self):
+        """Map pre-lookup-table history.backend name strings to kind ids
+
+        Old rows stored 'openai' etc. directly; read through the
+        int-typed column they all collapsed to "custom". Known names map
+        to their seeded ids, anything unrecognized genuinely becomes
+        custom. The legacy column keeps its TEXT affinity, so mapped ids
+        land as digit strings — the catch-all therefore skips digit text
+        (which also makes a second run a no-op) and backend_name decodes
+        both shapes.
+        """
+        try:
+            with self.engine.begin() as conn:
+                for name, kind_id in BACKEND_KIND_IDS.items():
+                    conn.exec_driver_sql(
+                        "UPDATE history SET backend = ? WHERE backend = ?",
+                        (kind_id, name),
+                    )
+                conn.exec_driver_sql(
+                    "UPDATE history SET backend = ? "
+                    "WHERE typeof(backend) = 'text' AND NOT backend GLOB '[0-9]*'",
+                    (BACKEND_KIND_IDS["custom"],),
+                )
+        except Exception as e:
+            print(f"Error migrating legacy backend names: {e}")
+
     def get_session(self) -> Session:
         """Get database session"""
         return Session(self.engine)
@@ -3,26 +3,56 @@ Main application window for Prompt Studio
 """
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QListWidget, QListWidgetItem,
-    QTextEdit, QLineEdit, QPushButton, QLabel, QFrame, QTabWidget,
-    QComboBox, QProgressBar, QMenuBar, QMenu, QStatusBar,
+    QTreeWidget, QTreeWidgetItem, QListWidget, QListWidgetItem, QListView,
+    QTextEdit, QPlainTextEdit, QLineEdit, QPushButton, QLabel, QFrame, QTabWidget,
+    QComboBox, QProgressBar, QProgressDialog, QMenuBar, QMenu, QStatusBar,
     QToolBar, QCheckBox, QSpinBox, QDoubleSpinBox, QScrollArea,
     QGroupBox, QFormLayout, QMessageBox, QFileDialog, QApplication
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread, QObject, QRunnable, QThreadPool
-from PySide6.QtGui import QAction, QIcon, QFont, QKeySequence, QShortcut, QClipboard
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QThread, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QMimeData, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import QAction, QIcon, QFont, QKeySequence, QShortcut, QClipboard, QTextCursor
 import asyncio
-from typing import Optional, Dict, List, Any
-from datetime import datetime
+from functools import partial
+from typing import Optional, Dict, List, Any, NamedTuple
 import webbrowser
 import urllib.parse
 
 from sqlmodel import select
+from sqlalchemy import update
 from ..models.database import DatabaseManager, Prompt, Tag, History
 from ..utils.csv_import import CSVImporter
 from ..utils.templating import template_engine, prompt_composer, PlaceholderSchema
 from ..backends.llm_backends import backend_manager
 
+# AI platforms offered by the "Open in AI Platform" menu
+# Prompts longer than this are handed off via clipboard instead of a URL:
+# browsers and the target sites reject query strings in that range anyway
+MAX_URL_PROMPT_CHARS = 6000
+
+# urllib.parse.quote equivalent for ASCII text as one str.translate pass
+# (same safe set as quote's default, including '/')
+_URL_ENCODE_TABLE = str.maketrans({
+    chr(code): '%{:02X}'.format(code)
+    for code in range(128)
+    if chr(code) not in
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/"
+})
+
+AI_PLATFORMS = (
+    ("chatgpt", "ChatGPT"),
+    ("gemini", "Google Gemini"),
+    ("claude", "Claude"),
+    ("deepseek", "DeepSeek"),
+)
+
+# Shortcut sequences parsed once at import instead of per setup call
+QUICK_OPEN_SEQUENCE = QKeySequence("Ctrl+K")
+RUN_SEQUENCE = QKeySequence("Ctrl+Return")
+STOP_SEQUENCE = QKeySequence("Escape")
+
 
 class ModelLoadWorker(QThread):
     """Worker thread for loading models asynchronously"""
@@ -38,52 +68,237 @@ class ModelLoadWorker(QThread):
         try:
             backend = backend_manager.get_backend(self.backend_name)
             if backend:
-                # Create an event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    models = loop.run_until_complete(backend.list_models())
-                    self.models_loaded.emit(models)
-                finally:
-                    loop.close()
+                # Schedule onto the shared backend loop instead of paying
+                # event-loop setup/teardown per backend switch
+                future = asyncio.run_coroutine_threadsafe(
+                    backend.list_models(), backend_manager.background_loop()
+                )
+                self.models_loaded.emit(future.result(timeout=30))
             else:
                 self.error_occurred.emit(f"Backend {self.backend_name} not found")
         except Exception as e:
             self.error_occurred.emit(str(e))
 
 
-class PromptListWidget(QListWidget):
-    """Custom list widget for prompts with enhanced functionality"""
-    
+class PromptListRow(NamedTuple):
+    """Narrow projection of a Prompt for the sidebar list
+
+    Plain tuple fields instead of ORM attribute proxies; the full Prompt
+    is only fetched (by id) once a row is selected.
+    """
+    id: str
+    display: str
+    description: Optional[str]
+    content: str
+
+    @classmethod
+    def from_prompt(cls, prompt: Prompt) -> "PromptListRow":
+        """Build a row from a loaded Prompt instance"""
+        return cls(
+            id=prompt.id,
+            display=f"⭐ {prompt.name}" if prompt.is_favorite else prompt.name,
+            description=prompt.description,
+            content=prompt.content,
+        )
+
+    @property
+    def tooltip(self) -> str:
+        """Tooltip text, built on demand when a row is hovered"""
+        return self.description or self.content[:100] + "..."
+
+
+class CSVImportWorker(QThread):
+    """Worker thread that runs a CSV import off the UI thread"""
+    progress = Signal(int)  # rows processed so far
+    finished_stats = Signal(dict)
+    error_occurred = Signal(str)
+
+    def __init__(self, db_manager, file_path: str, update_existing: bool = False):
+        super().__init__()
+        self.db_manager = db_manager
+        self.file_path = file_path
+        self.update_existing = update_existing
+
+    def run(self):
+        """Parse and import the file on this thread"""
+        try:
+            importer = CSVImporter(self.db_manager)
+            stats = importer.import_prompts(
+                self.file_path,
+                update_existing=self.update_existing,
+                progress_callback=self.progress.emit
+            )
+            self.finished_stats.emit(stats)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class OpenUrlRunnable(QRunnable):
+    """Opens a URL in the system browser off the UI thread
+
+    webbrowser.open can spawn the browser subprocess synchronously and
+    stall for seconds on some platforms; running it in the thread pool
+    keeps the main loop pumping.
+    """
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+
+    def run(self):
+        try:
+            webbrowser.open(self.url)
+        except Exception as e:
+            print(f"Error opening browser: {e}")
+
+
+class PromptLoadSignals(QObject):
+    """Signals for PromptLoadWorker"""
+    prompts_loaded = Signal(list)
+    filters_loaded = Signal(list, list)  # categories, tag names
+    error_occurred = Signal(str)
+
+
+class PromptLoadWorker(QRunnable):
+    """Worker that loads prompts from the database off the UI thread"""
+
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        self.signals = PromptLoadSignals()
+
+    def run(self):
+        """Query the list columns in the thread pool
+
+        Projects only the columns the sidebar paints, so the database
+        returns narrow tuples instead of hydrating full ORM rows.
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                rows = session.exec(
+                    select(Prompt.id, Prompt.name, Prompt.description,
+                           Prompt.content, Prompt.is_favorite)
+                ).all()
+
+                # Sidebar filters come from aggregate SQL instead of a
+                # Python union over the prompt rows
+                categories = session.exec(
+                    select(Prompt.category).distinct()
+                ).all()
+                tag_names = session.exec(select(Tag.name)).all()
+
+            prompt_rows = [
+                PromptListRow(
+                    id=prompt_id,
+                    display=f"⭐ {name}" if is_favorite else name,
+                    description=description,
+                    content=content,
+                )
+                for prompt_id, name, description, content, is_favorite in rows
+            ]
+            self.signals.prompts_loaded.emit(prompt_rows)
+            self.signals.filters_loaded.emit(
+                sorted(category for category in categories if category),
+                sorted(tag_names)
+            )
+        except Exception as e:
+            self.signals.error_occurred.emit(str(e))
+
+
+class PromptModel(QAbstractListModel):
+    """List model over the loaded prompt list rows
+
+    Rows are plain PromptListRow tuples; the view only asks for the
+    handful of roles it actually paints, so no per-row QListWidgetItem
+    is allocated.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._prompts: List[PromptListRow] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._prompts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._prompts[index.row()]
+        if role == Qt.DisplayRole:
+            return row.display
+        if role == Qt.ToolTipRole:
+            return row.tooltip
+        if role == Qt.UserRole:
+            return row.id
+        return None
+
+    def add_prompts(self, prompts: List[PromptListRow]):
+        """Append rows as a single insert (one model change signal)"""
+        if not prompts:
+            return
+        first = len(self._prompts)
+        self.beginInsertRows(QModelIndex(), first, first + len(prompts) - 1)
+        self._prompts.extend(prompts)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all prompts"""
+        self.beginResetModel()
+        self._prompts = []
+        self.endResetModel()
+
+
+class PromptListWidget(QListView):
+    """Prompt list view backed by a filter proxy model
+
+    Filtering happens in the proxy (C++ side) instead of a Python loop
+    over per-item setHidden calls.
+    """
+
     prompt_selected = Signal(str)  # Emits prompt ID
-    
+
     def __init__(self):
         super().__init__()
         self.setAlternatingRowColors(True)
-        self.setSelectionMode(QListWidget.ExtendedSelection)
-        
+        self.setSelectionMode(QListView.ExtendedSelection)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        # Long names are elided in the C++ paint path; uniform sizes let
+        # the view lay out by multiplication instead of measuring rows
+        self.setTextElideMode(Qt.ElideRight)
+        self.setUniformItemSizes(True)
+
+        self.source_model = PromptModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.source_model)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setModel(self.proxy_model)
+
     def add_prompt(self, prompt: Prompt):
-        """Add a prompt to the list"""
-        item = QListWidgetItem()
-        item.setText(prompt.name)
-        item.setData(Qt.UserRole, prompt.id)
-        item.setToolTip(prompt.description or prompt.content[:100] + "...")
-        
-        # Add visual indicators
-        if prompt.is_favorite:
-            item.setText(f"⭐ {prompt.name}")
-        
-        self.addItem(item)
-    
+        """Add a single loaded Prompt to the list"""
+        self.source_model.add_prompts([PromptListRow.from_prompt(prompt)])
+
+    def add_prompts(self, prompts: List[PromptListRow]):
+        """Add many rows as one batched model insert"""
+        self.source_model.add_prompts(prompts)
+
     def clear_prompts(self):
         """Clear all prompts from the list"""
-        self.clear()
-    
+        self.source_model.clear()
+
+    def count(self) -> int:
+        """Number of loaded prompts (ignoring the active filter)"""
+        return self.source_model.rowCount()
+
+    def set_filter_text(self, text: str):
+        """Filter visible prompts by substring match on the name"""
+        self.proxy_model.setFilterFixedString(text)
+
     def get_selected_prompt_ids(self) -> List[str]:
         """Get IDs of selected prompts"""
         selected_ids = []
-        for item in self.selectedItems():
-            prompt_id = item.data(Qt.UserRole)
+        for index in self.selectionModel().selectedIndexes():
+            prompt_id = index.data(Qt.UserRole)
             if prompt_id:
                 selected_ids.append(prompt_id)
         return selected_ids
@@ -103,151 +318,250 @@ class PlaceholderFormWidget(QScrollArea):
         self.setWidget(self.container)
         
         self.form_widgets = {}  # Maps field names to widgets
-        
+        # Pools of hidden (group, widget, desc_label) triples keyed by field
+        # type; switching prompts rebinds labels and values instead of
+        # destroying and reconstructing the whole form
+        self._pool: Dict[str, list] = {}
+        self._field_groups = {}  # Maps field names to (type, group, widget, desc_label)
+        # Live values mirror, kept current by the widgets' change signals
+        # so get_values never has to walk the form
+        self._values: Dict[str, Any] = {}
+        self._widget_names = {}  # Maps widgets to their bound field name
+
     def set_schema(self, schema: List[Dict[str, Any]]):
         """Set the placeholder schema and create form fields"""
         self.clear_form()
-        
+
         for field in schema:
             self._create_field_widget(field)
-    
+
     def clear_form(self):
-        """Clear all form fields"""
-        for widget in self.form_widgets.values():
-            widget.deleteLater()
+        """Hide all form fields and return them to the type pools"""
+        for field_type, group, widget, desc_label in self._field_groups.values():
+            group.hide()
+            self.layout.removeWidget(group)
+            self._pool.setdefault(field_type, []).append((group, widget, desc_label))
+        self._field_groups.clear()
         self.form_widgets.clear()
-        
-        # Clear layout
-        while self.layout.count():
-            child = self.layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-    
+        self._values.clear()
+
     def _create_field_widget(self, field: Dict[str, Any]):
-        """Create a widget for a single field"""
+        """Create (or reuse a pooled) widget for a single field"""
         name = field["name"]
         field_type = field.get("type", "str")
         required = field.get("required", False)
-        default = field.get("default", "")
         description = field.get("description", "")
-        
-        # Create group box for the field
-        group = QGroupBox()
+
+        pooled = self._pool.get(field_type)
+        if pooled:
+            group, widget, desc_label = pooled.pop()
+        else:
+            group = QGroupBox()
+            form_layout = QFormLayout(group)
+
+            desc_label = QLabel()
+            desc_label.setWordWrap(True)
+            desc_label.setStyleSheet("color: gray; font-size: 10pt;")
+            form_layout.addRow(desc_label)
+
+            widget = self._construct_input_widget(field_type)
+            form_layout.addRow(widget)
+
         label_text = name
         if required:
             label_text += " *"
         group.setTitle(label_text)
-        
-        form_layout = QFormLayout(group)
-        
-        # Create appropriate widget based on type
+
+        desc_label.setText(description)
+        desc_label.setVisible(bool(description))
+
+        # Rebind the name before defaults so change signals fired by the
+        # binding land on the right key
+        self._widget_names[widget] = name
+        self._bind_default(widget, field_type, field)
+        self._values[name] = self._read_value(widget)
+        group.show()
+
+        self.form_widgets[name] = widget
+        self._field_groups[name] = (field_type, group, widget, desc_label)
+        self.layout.addWidget(group)
+
+    def _construct_input_widget(self, field_type: str):
+        """Construct a bare input widget for a field type"""
         if field_type == "text":
             widget = QTextEdit()
-            widget.setPlainText(str(default))
             widget.setMaximumHeight(100)
+            widget.textChanged.connect(partial(self._on_field_changed, widget))
         elif field_type == "int":
             widget = QSpinBox()
             widget.setMinimum(-999999)
             widget.setMaximum(999999)
-            widget.setValue(int(default) if default else 0)
+            widget.valueChanged.connect(partial(self._on_field_changed, widget))
         elif field_type == "float":
             widget = QDoubleSpinBox()
             widget.setMinimum(-999999.99)
             widget.setMaximum(999999.99)
-            widget.setValue(float(default) if default else 0.0)
+            widget.valueChanged.connect(partial(self._on_field_changed, widget))
         elif field_type == "bool":
             widget = QCheckBox()
-            widget.setChecked(bool(default))
+            widget.stateChanged.connect(partial(self._on_field_changed, widget))
         elif field_type == "choice":
             widget = QComboBox()
-            options = field.get("options", [])
-            widget.addItems(options)
-            if default in options:
-                widget.setCurrentText(str(default))
+            widget.currentTextChanged.connect(partial(self._on_field_changed, widget))
         elif field_type == "multichoice":
             # For multichoice, we'll use a simple text edit for now
             # In a more complex implementation, you'd use checkboxes
             widget = QTextEdit()
             widget.setMaximumHeight(60)
+            widget.textChanged.connect(partial(self._on_field_changed, widget))
+        else:  # str type
+            widget = QLineEdit()
+            widget.textChanged.connect(partial(self._on_field_changed, widget))
+        return widget
+
+    def _on_field_changed(self, widget, *args):
+        """Mirror a single changed widget's value into the live dict"""
+        name = self._widget_names.get(widget)
+        if name is not None:
+            self._values[name] = self._read_value(widget)
+
+    @staticmethod
+    def _read_value(widget):
+        """Read the current value out of a field widget"""
+        if isinstance(widget, QTextEdit):
+            return widget.toPlainText()
+        if isinstance(widget, QLineEdit):
+            return widget.text()
+        if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            return widget.value()
+        if isinstance(widget, QCheckBox):
+            return widget.isChecked()
+        if isinstance(widget, QComboBox):
+            return widget.currentText()
+        return None
+
+    def _bind_default(self, widget, field_type: str, field: Dict[str, Any]):
+        """Bind a field's default value (and options) onto its widget"""
+        default = field.get("default", "")
+
+        if field_type == "text":
+            widget.setPlainText(str(default))
+        elif field_type == "int":
+            widget.setValue(int(default) if default else 0)
+        elif field_type == "float":
+            widget.setValue(float(default) if default else 0.0)
+        elif field_type == "bool":
+            widget.setChecked(bool(default))
+        elif field_type == "choice":
+            options = field.get("options", [])
+            widget.clear()
+            widget.addItems(options)
+            if default in options:
+                widget.setCurrentText(str(default))
+        elif field_type == "multichoice":
             options = field.get("options", [])
             widget.setPlaceholderText(f"Options: {', '.join(options)}")
-            if isinstance(default, list):
-                widget.setPlainText(", ".join(default))
+            widget.setPlainText(", ".join(default) if isinstance(default, list) else "")
         else:  # str type
-            widget = QLineEdit()
             widget.setText(str(default))
-        
-        if description:
-            desc_label = QLabel(description)
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: gray; font-size: 10pt;")
-            form_layout.addRow(desc_label)
-        
-        form_layout.addRow(widget)
-        
-        self.form_widgets[name] = widget
-        self.layout.addWidget(group)
     
     def get_values(self) -> Dict[str, Any]:
-        """Get current values from all form fields"""
-        values = {}
-        
-        for name, widget in self.form_widgets.items():
-            if isinstance(widget, QTextEdit):
-                values[name] = widget.toPlainText()
-            elif isinstance(widget, QLineEdit):
-                values[name] = widget.text()
-            elif isinstance(widget, QSpinBox):
-                values[name] = widget.value()
-            elif isinstance(widget, QDoubleSpinBox):
-                values[name] = widget.value()
-            elif isinstance(widget, QCheckBox):
-                values[name] = widget.isChecked()
-            elif isinstance(widget, QComboBox):
-                values[name] = widget.currentText()
-        
-        return values
+        """Get current values from all form fields
+
+        Constant time: the dict is kept current by the widgets' change
+        signals instead of re-reading every widget per call.
+        """
+        return dict(self._values)
 
 
 class ConsoleWidget(QTabWidget):
     """Console widget for displaying LLM responses"""
-    
+
+    # Scroll-back caps: oldest blocks drop in O(1) instead of the whole
+    # document being re-laid-out as streaming sessions grow
+    OUTPUT_BLOCK_LIMIT = 5000
+    RAW_BLOCK_LIMIT = 2000
+    FLUSH_INTERVAL_MS = 30  # coalesce streamed chunks into one repaint
+
     def __init__(self):
         super().__init__()
         self.setTabPosition(QTabWidget.South)
-        
+
+        # Streamed chunks buffer here and flush on a short timer, so a
+        # token burst costs one layout pass instead of one per token
+        self._pending_output: List[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_console)
+        
+        # QPlainTextEdit scales with append-only log content far better
+        # than QTextEdit's rich-text document
+
         # Output tab
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.document().setUndoRedoEnabled(False)
         self.output_text.setFont(QFont("Monaco", 11))
+        self.output_text.setMaximumBlockCount(self.OUTPUT_BLOCK_LIMIT)
         self.addTab(self.output_text, "Output")
-        
+
         # Stats tab
-        self.stats_text = QTextEdit()
+        self.stats_text = QPlainTextEdit()
         self.stats_text.setReadOnly(True)
+        self.stats_text.document().setUndoRedoEnabled(False)
         self.addTab(self.stats_text, "Stats")
-        
+
         # Raw tab
-        self.raw_text = QTextEdit()
+        self.raw_text = QPlainTextEdit()
         self.raw_text.setReadOnly(True)
+        self.raw_text.document().setUndoRedoEnabled(False)
+        self.raw_text.setMaximumBlockCount(self.RAW_BLOCK_LIMIT)
         self.addTab(self.raw_text, "Raw")
-    
+
+    def set_scrollback_limits(self, output_blocks: int, raw_blocks: int):
+        """Tune the scroll-back caps (e.g. from settings)"""
+        self.output_text.setMaximumBlockCount(output_blocks)
+        self.raw_text.setMaximumBlockCount(raw_blocks)
+
     def clear_output(self):
         """Clear all console output"""
+        self._pending_output.clear()
+        self._flush_timer.stop()
         self.output_text.clear()
         self.stats_text.clear()
         self.raw_text.clear()
-    
+
     def append_output(self, text: str):
-        """Append text to output tab"""
-        self.output_text.append(text)
-    
+        """Append a line of text to the output tab"""
+        self.stream_output(text + "\n")
+
+    def stream_output(self, text: str):
+        """Queue a streamed chunk; flushed in batches by the timer"""
+        self._pending_output.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_console(self):
+        """Insert all pending chunks as one edit and repaint once"""
+        self._flush_timer.stop()
+        if not self._pending_output:
+            return
+
+        joined = "".join(self._pending_output)
+        self._pending_output.clear()
+
+        self.output_text.moveCursor(QTextCursor.End)
+        self.output_text.insertPlainText(joined)
+
+
     def set_stats(self, stats: Dict[str, Any]):
         """Set statistics information"""
-        stats_text = []
-        for key, value in stats.items():
-            stats_text.append(f"{key}: {value}")
-        self.stats_text.setPlainText("\n".join(stats_text))
+        self.stats_text.setPlainText(
+            "\n".join(
+                f"{key}: {value:.4g}" if isinstance(value, float) else f"{key}: {value}"
+                for key, value in stats.items()
+            )
+        )
     
     def set_raw(self, raw_data: str):
         """Set raw response data"""
@@ -264,7 +578,34 @@ class MainWindow(QMainWindow):
         
         self.current_prompt: Optional[Prompt] = None
         self.current_values = {}
-        
+        # Per-prompt (content, schema) cache so template analysis runs
+        # once per edit instead of on every selection/copy
+        self._schema_cache: Dict[str, tuple] = {}
+        # Schema of the selected prompt, resolved once at selection time
+        # so Run/Copy/Open don't even pay the cache lookup per click
+        self._current_schema: List[Dict[str, Any]] = []
+        # Last composed render, keyed by (prompt id, content, values);
+        # Run/Copy/Open reuse it instead of re-rendering the template
+        self._render_cache: Optional[tuple] = None
+        # Reused dialogs: constructing a QMessageBox re-lays-out its rich
+        # text each time, and the clipboard one fires on every browser open
+        self._clipboard_msg = QMessageBox(
+            QMessageBox.Information, "Prompt Copied", "", QMessageBox.Ok, self
+        )
+        self._clipboard_msg.setInformativeText(
+            "Your prompt has been copied to the clipboard. Paste it (Ctrl+V/Cmd+V) in the chat window."
+        )
+        self._clipboard_msg.setDefaultButton(QMessageBox.Ok)
+        self._about_msg: Optional[QMessageBox] = None
+        self._credits_msg: Optional[QMessageBox] = None
+        # Debounce backend switches so rapid combo navigation starts one
+        # model fetch; stale worker results are dropped by sequence number
+        self._model_load_timer = QTimer(self)
+        self._model_load_timer.setSingleShot(True)
+        self._model_load_timer.setInterval(250)
+        self._model_load_timer.timeout.connect(self._do_update_models)
+        self._model_load_seq = 0
+
         self.setup_ui()
         self.setup_menu_bar()
         self.setup_toolbar()
@@ -330,27 +671,34 @@ class MainWindow(QMainWindow):
         """Setup the left sidebar"""
         sidebar = QWidget()
         sidebar_layout = QVBoxLayout(sidebar)
-        
+
+        # Debounce filter triggers: fast typing restarts the timer, so
+        # only the final text runs a filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_prompts)
+
         # Search box
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search prompts...")
-        self.search_input.textChanged.connect(self.filter_prompts)
+        self.search_input.textChanged.connect(self._schedule_filter)
         sidebar_layout.addWidget(self.search_input)
-        
+
         # Filters
         filters_group = QGroupBox("Filters")
         filters_layout = QVBoxLayout(filters_group)
-        
+
         # Category filter
         self.category_combo = QComboBox()
         self.category_combo.addItem("All Categories")
-        self.category_combo.currentTextChanged.connect(self.filter_prompts)
+        self.category_combo.currentTextChanged.connect(self._schedule_filter)
         filters_layout.addWidget(QLabel("Category:"))
         filters_layout.addWidget(self.category_combo)
-        
+
         # Favorites checkbox
         self.favorites_checkbox = QCheckBox("Show only favorites")
-        self.favorites_checkbox.stateChanged.connect(self.filter_prompts)
+        self.favorites_checkbox.stateChanged.connect(self._schedule_filter)
         filters_layout.addWidget(self.favorites_checkbox)
         
         sidebar_layout.addWidget(filters_group)
@@ -373,7 +721,7 @@ class MainWindow(QMainWindow):
         
         # Prompt list
         self.prompt_list = PromptListWidget()
-        self.prompt_list.itemSelectionChanged.connect(self.on_prompt_selected)
+        self.prompt_list.selectionModel().selectionChanged.connect(self.on_prompt_selected)
         center_layout.addWidget(self.prompt_list)
         
         parent_splitter.addWidget(center_widget)
@@ -417,6 +765,8 @@ class MainWindow(QMainWindow):
         
         self.prompt_preview = QTextEdit()
         self.prompt_preview.setReadOnly(True)
+        # No undo stack while read-only; re-enabled for edit mode
+        self.prompt_preview.document().setUndoRedoEnabled(False)
         self.prompt_preview.setMaximumHeight(150)
         details_layout.addWidget(self.prompt_preview)
         
@@ -480,23 +830,13 @@ class MainWindow(QMainWindow):
         
         # Create menu for different AI platforms
         self.browser_menu = QMenu(self)
-        
-        chatgpt_action = QAction("ChatGPT", self)
-        chatgpt_action.triggered.connect(lambda: self.open_in_ai_platform("chatgpt"))
-        self.browser_menu.addAction(chatgpt_action)
-        
-        gemini_action = QAction("Google Gemini", self)
-        gemini_action.triggered.connect(lambda: self.open_in_ai_platform("gemini"))
-        self.browser_menu.addAction(gemini_action)
-        
-        claude_action = QAction("Claude", self)
-        claude_action.triggered.connect(lambda: self.open_in_ai_platform("claude"))
-        self.browser_menu.addAction(claude_action)
-        
-        deepseek_action = QAction("DeepSeek", self)
-        deepseek_action.triggered.connect(lambda: self.open_in_ai_platform("deepseek"))
-        self.browser_menu.addAction(deepseek_action)
-        
+        self.browser_menu.setToolTipsVisible(False)
+
+        for platform, label in AI_PLATFORMS:
+            action = QAction(label, self)
+            action.triggered.connect(partial(self.open_in_ai_platform, platform))
+            self.browser_menu.addAction(action)
+
         self.browser_button.setMenu(self.browser_menu)
         actions_layout.addWidget(self.browser_button)
         
@@ -616,54 +956,71 @@ class MainWindow(QMainWindow):
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
         # Quick open shortcut (Ctrl+K)
-        quick_open_shortcut = QShortcut(QKeySequence("Ctrl+K"), self)
+        quick_open_shortcut = QShortcut(QUICK_OPEN_SEQUENCE, self)
         quick_open_shortcut.activated.connect(self.show_quick_open)
-        
+
         # Run shortcut (Ctrl+Return)
-        run_shortcut = QShortcut(QKeySequence("Ctrl+Return"), self)
+        run_shortcut = QShortcut(RUN_SEQUENCE, self)
         run_shortcut.activated.connect(self.run_prompt)
-        
+
         # Stop shortcut (Escape)
-        stop_shortcut = QShortcut(QKeySequence("Escape"), self)
+        stop_shortcut = QShortcut(STOP_SEQUENCE, self)
         stop_shortcut.activated.connect(self.stop_execution)
     
     def refresh_prompts(self):
-        """Refresh the prompt list from database"""
+        """Refresh the prompt list; the DB query runs off the UI thread"""
+        worker = PromptLoadWorker(self.db_manager)
+        worker.signals.prompts_loaded.connect(self.on_prompts_loaded)
+        worker.signals.filters_loaded.connect(self.on_filters_loaded)
+        worker.signals.error_occurred.connect(self.on_prompt_load_error)
+        self._prompt_load_worker = worker  # keep signal source alive
+        QThreadPool.globalInstance().start(worker)
+
+    def on_prompts_loaded(self, prompts: List[PromptListRow]):
+        """Populate the prompt list with rows loaded by the worker"""
         self.prompt_list.clear_prompts()
-        
-        with self.db_manager.get_session() as session:
-            prompts = session.exec(select(Prompt)).all()
-            
-            for prompt in prompts:
-                self.prompt_list.add_prompt(prompt)
-        
+        self.prompt_list.add_prompts(prompts)
+
         self.status_bar.showMessage(f"Loaded {self.prompt_list.count()} prompts")
+
+    def on_filters_loaded(self, categories: List[str], tag_names: List[str]):
+        """Repopulate the category combo and tags list from aggregates"""
+        current_category = self.category_combo.currentText()
+
+        self.category_combo.blockSignals(True)
+        try:
+            self.category_combo.clear()
+            self.category_combo.addItem("All Categories")
+            self.category_combo.addItems(categories)
+            index = self.category_combo.findText(current_category)
+            if index >= 0:
+                self.category_combo.setCurrentIndex(index)
+        finally:
+            self.category_combo.blockSignals(False)
+
+        self.tags_list.clear()
+        self.tags_list.addItems(tag_names)
+
+    def on_prompt_load_error(self, error_msg: str):
+        """Handle prompt loading errors"""
+        self.status_bar.showMessage(f"Failed to load prompts: {error_msg}", 5000)
     
+    def _schedule_filter(self, *args):
+        """(Re)start the debounce timer; args from the signals are ignored"""
+        self._filter_timer.start()
+
     def filter_prompts(self):
         """Filter prompts based on search and filter criteria"""
-        search_text = self.search_input.text().lower()
-        category_filter = self.category_combo.currentText()
-        show_favorites_only = self.favorites_checkbox.isChecked()
-        
-        for i in range(self.prompt_list.count()):
-            item = self.prompt_list.item(i)
-            prompt_name = item.text().lower()
-            
-            # Apply filters
-            show_item = True
-            
-            if search_text and search_text not in prompt_name:
-                show_item = False
-            
-            # TODO: Add category and favorites filtering
-            
-            item.setHidden(not show_item)
-    
+        self.prompt_list.set_filter_text(self.search_input.text())
+
+        # TODO: Add category and favorites filtering
+
     def on_prompt_selected(self):
         """Handle prompt selection"""
-        selected_items = self.prompt_list.selectedItems()
-        if not selected_items:
+        selected_ids = self.prompt_list.get_selected_prompt_ids()
+        if not selected_ids:
             self.current_prompt = None
+            self._current_schema = []
             self.prompt_name_label.setText("Select a prompt")
             self.prompt_description_label.setText("")
             self.prompt_preview.clear()
@@ -672,10 +1029,9 @@ class MainWindow(QMainWindow):
             self._enable_prompt_buttons(False)
             return
         
-        # Get the first selected item
-        item = selected_items[0]
-        prompt_id = item.data(Qt.UserRole)
-        
+        # Get the first selected prompt
+        prompt_id = selected_ids[0]
+
         with self.db_manager.get_session() as session:
             prompt = session.get(Prompt, prompt_id)
             if prompt:
@@ -685,24 +1041,63 @@ class MainWindow(QMainWindow):
                 self.prompt_preview.setPlainText(prompt.content)
                 
                 # Setup placeholder form
-                schema = prompt.get_placeholders_schema()
+                schema = self._effective_schema(prompt)
+                self._current_schema = schema
                 if schema:
                     self.placeholder_form.set_schema(schema)
                     # Get default values
                     self.current_values = prompt_composer.get_default_values(schema)
                 else:
-                    # Auto-detect placeholders
-                    placeholders = template_engine.extract_placeholders(prompt.content)
-                    if placeholders:
-                        auto_schema = PlaceholderSchema.create_schema_from_placeholders(placeholders)
-                        self.placeholder_form.set_schema(auto_schema)
-                        self.current_values = prompt_composer.get_default_values(auto_schema)
-                    else:
-                        self.placeholder_form.clear_form()
-                        self.current_values = {}
-                
+                    self.placeholder_form.clear_form()
+                    self.current_values = {}
+
                 self._enable_prompt_buttons(True)
-    
+
+    def _effective_schema(self, prompt: Prompt) -> List[Dict[str, Any]]:
+        """Explicit or auto-detected placeholder schema for a prompt
+
+        Cached per prompt id and keyed on content, so the template is only
+        re-analyzed after an edit rather than on every selection or copy.
+        """
+        cached = self._schema_cache.get(prompt.id)
+        if cached is not None and cached[0] == prompt.content:
+            return cached[1]
+
+        schema = prompt.get_placeholders_schema()
+        if not schema:
+            placeholders = template_engine.extract_placeholders(prompt.content)
+            if placeholders:
+                schema = PlaceholderSchema.create_schema_from_placeholders(placeholders)
+            else:
+                schema = []
+
+        self._schema_cache[prompt.id] = (prompt.content, schema)
+        return schema
+
+    def _get_rendered(self) -> Dict[str, Any]:
+        """Compose the current prompt, reusing the last identical render
+
+        The cache key covers the prompt id, its content and the current
+        form values, so clicking Run then Copy (or repeated opens) pays
+        for one template render instead of one per button.
+        """
+        values = self.placeholder_form.get_values()
+        key = (
+            self.current_prompt.id,
+            self.current_prompt.content,
+            tuple(sorted(values.items(), key=lambda item: item[0])),
+        )
+        if self._render_cache is not None and self._render_cache[0] == key:
+            return self._render_cache[1]
+
+        result = prompt_composer.compose_prompt(
+            self.current_prompt.content,
+            values,
+            self._current_schema
+        )
+        self._render_cache = (key, result)
+        return result
+
     def _enable_prompt_buttons(self, enabled: bool):
         """Enable/disable prompt-related buttons"""
         self.run_button.setEnabled(enabled)
@@ -722,6 +1117,7 @@ class MainWindow(QMainWindow):
             self.edit_mode = True
             self.original_content = self.prompt_preview.toPlainText()
             self.prompt_preview.setReadOnly(False)
+            self.prompt_preview.document().setUndoRedoEnabled(True)
             self.edit_button.setText("Editing...")
             self.edit_button.setEnabled(False)
             
@@ -735,28 +1131,36 @@ class MainWindow(QMainWindow):
             return
             
         new_content = self.prompt_preview.toPlainText()
-        
-        # Update in database
+
+        # Nothing changed: skip the write and the template re-analysis
+        if new_content == self.original_content:
+            self._exit_edit_mode()
+            return
+
+        # Update in database: one UPDATE round-trip, no SELECT + ORM
+        # dirty tracking; updated_at is maintained by the column's onupdate
         with self.db_manager.get_session() as session:
-            prompt = session.get(Prompt, self.current_prompt.id)
-            if prompt:
-                prompt.content = new_content
-                prompt.updated_at = datetime.utcnow()
-                session.commit()
-                
-                # Update current prompt object
-                self.current_prompt.content = new_content
-                
-                # Re-analyze placeholders
-                placeholders = template_engine.extract_placeholders(new_content)
-                if placeholders:
-                    auto_schema = PlaceholderSchema.create_schema_from_placeholders(placeholders)
-                    self.placeholder_form.set_schema(auto_schema)
-                    self.current_values = prompt_composer.get_default_values(auto_schema)
-                else:
-                    self.placeholder_form.clear_form()
-                    self.current_values = {}
-        
+            session.exec(
+                update(Prompt)
+                .where(Prompt.id == self.current_prompt.id)
+                .values(content=new_content)
+            )
+            session.commit()
+
+        # Update current prompt object
+        self.current_prompt.content = new_content
+
+        # Re-analyze placeholders (drop the stale cache entry first)
+        self._schema_cache.pop(self.current_prompt.id, None)
+        schema = self._effective_schema(self.current_prompt)
+        self._current_schema = schema
+        if schema:
+            self.placeholder_form.set_schema(schema)
+            self.current_values = prompt_composer.get_default_values(schema)
+        else:
+            self.placeholder_form.clear_form()
+            self.current_values = {}
+
         # Exit edit mode
         self._exit_edit_mode()
         self.status_bar.showMessage("Prompt saved successfully", 2000)
@@ -774,6 +1178,7 @@ class MainWindow(QMainWindow):
         """Exit edit mode and restore read-only state"""
         self.edit_mode = False
         self.prompt_preview.setReadOnly(True)
+        self.prompt_preview.document().setUndoRedoEnabled(False)
         self.edit_button.setText("Edit")
         self.edit_button.setEnabled(True)
         
@@ -785,32 +1190,33 @@ class MainWindow(QMainWindow):
         """Copy the template to clipboard"""
         if not self.current_prompt:
             return
-            
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.prompt_preview.toPlainText())
+
+        self._copy_text(self.prompt_preview.toPlainText())
         self.status_bar.showMessage("Template copied to clipboard", 2000)
+
+    def _copy_text(self, text: str):
+        """Put plain text on the clipboard in one round-trip
+
+        A plain-text QMimeData skips Qt's rich-text inference and emits a
+        single dataChanged to listeners per user action.
+        """
+        mime = QMimeData()
+        mime.setText(text)
+        QApplication.clipboard().setMimeData(mime)
     
     def copy_rendered_prompt(self):
         """Copy the rendered prompt to clipboard"""
         if not self.current_prompt:
             return
             
-        # Get values from form and render
-        values = self.placeholder_form.get_values()
-        schema = self.current_prompt.get_placeholders_schema()
-        
-        result = prompt_composer.compose_prompt(
-            self.current_prompt.content,
-            values,
-            schema
-        )
-        
+        # Render (or reuse the cached render)
+        result = self._get_rendered()
+
         if result['errors'] or result['missing_required']:
             QMessageBox.warning(self, "Cannot Copy", "Please fill in all required parameters first")
             return
             
-        clipboard = QApplication.clipboard()
-        clipboard.setText(result['rendered'])
+        self._copy_text(result['rendered'])
         self.status_bar.showMessage("Rendered prompt copied to clipboard", 2000)
     
     def open_in_ai_platform(self, platform: str):
@@ -818,97 +1224,74 @@ class MainWindow(QMainWindow):
         if not self.current_prompt:
             return
             
-        # Get values from form and render
-        values = self.placeholder_form.get_values()
-        schema = self.current_prompt.get_placeholders_schema()
-        
-        result = prompt_composer.compose_prompt(
-            self.current_prompt.content,
-            values,
-            schema
-        )
-        
+        # Render (or reuse the cached render)
+        result = self._get_rendered()
+
         if result['errors'] or result['missing_required']:
             QMessageBox.warning(self, "Cannot Open", "Please fill in all required parameters first")
             return
             
-        # URL encode the prompt
-        encoded_prompt = urllib.parse.quote(result['rendered'])
-        
-        platform_names = {
-            "chatgpt": "ChatGPT",
-            "gemini": "Google Gemini", 
-            "claude": "Claude",
-            "deepseek": "DeepSeek"
-        }
-        
-        platform_name = platform_names.get(platform, platform)
-        
-        # Different strategies for different platforms
-        if platform == "chatgpt":
-            # ChatGPT supports URL parameters
-            url = f"https://chat.openai.com/?q={encoded_prompt}"
-            try:
-                webbrowser.open(url)
-                self.status_bar.showMessage(f"Opening {platform_name} with prompt...", 2000)
-            except Exception as e:
-                QMessageBox.critical(self, "Browser Error", f"Could not open browser: {str(e)}")
-                
-        elif platform == "gemini":
-            # Try Gemini with URL parameter, fallback to clipboard
-            url = f"https://gemini.google.com/app?q={encoded_prompt}"
-            try:
-                webbrowser.open(url)
-                self.status_bar.showMessage(f"Opening {platform_name} with prompt...", 2000)
-            except Exception as e:
-                self._fallback_clipboard_open("https://gemini.google.com/app", platform_name, result['rendered'])
-                
+        platform_name = dict(AI_PLATFORMS).get(platform, platform)
+
+        # Different strategies for different platforms; browser launches
+        # run in the thread pool so the UI never blocks on them
+        if platform in ("chatgpt", "gemini"):
+            # These accept the prompt as a URL parameter
+            base_url = ("https://chat.openai.com/" if platform == "chatgpt"
+                        else "https://gemini.google.com/app")
+            rendered = result['rendered']
+
+            # Past the practical URL length limit the site rejects the
+            # query anyway; skip encoding and hand off via clipboard
+            if len(rendered) > MAX_URL_PROMPT_CHARS:
+                self._fallback_clipboard_open(base_url, platform_name, rendered)
+                return
+
+            # ASCII fast path: a single translate pass produces the same
+            # %XX escapes as urllib.parse.quote without its overhead
+            if rendered.isascii():
+                encoded_prompt = rendered.translate(_URL_ENCODE_TABLE)
+            else:
+                encoded_prompt = urllib.parse.quote(rendered)
+
+            self._open_url_async(f"{base_url}?q={encoded_prompt}")
+            self.status_bar.showMessage(f"Opening {platform_name} with prompt...", 2000)
+
         elif platform == "claude":
             # Claude - copy to clipboard and open
-            clipboard = QApplication.clipboard()
-            clipboard.setText(result['rendered'])
-            try:
-                webbrowser.open("https://claude.ai/chat")
-                self._show_clipboard_message(platform_name)
-            except Exception as e:
-                QMessageBox.critical(self, "Browser Error", f"Could not open browser: {str(e)}")
-                
+            self._copy_text(result['rendered'])
+            self._open_url_async("https://claude.ai/chat")
+            self._show_clipboard_message(platform_name)
+
         elif platform == "deepseek":
             # DeepSeek - copy to clipboard and open
-            clipboard = QApplication.clipboard()
-            clipboard.setText(result['rendered'])
-            try:
-                webbrowser.open("https://chat.deepseek.com/")
-                self._show_clipboard_message(platform_name)
-            except Exception as e:
-                QMessageBox.critical(self, "Browser Error", f"Could not open browser: {str(e)}")
+            self._copy_text(result['rendered'])
+            self._open_url_async("https://chat.deepseek.com/")
+            self._show_clipboard_message(platform_name)
         else:
             QMessageBox.warning(self, "Unknown Platform", f"Platform '{platform}' is not supported")
-    
+
+    def _open_url_async(self, url: str):
+        """Open a URL in the browser without blocking the UI thread"""
+        QThreadPool.globalInstance().start(OpenUrlRunnable(url))
+
     def _fallback_clipboard_open(self, url: str, platform_name: str, prompt_text: str):
         """Fallback method: copy to clipboard and open platform"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(prompt_text)
-        try:
-            webbrowser.open(url)
-            self._show_clipboard_message(platform_name)
-        except Exception as e:
-            QMessageBox.critical(self, "Browser Error", f"Could not open browser: {str(e)}")
+        self._copy_text(prompt_text)
+        self._open_url_async(url)
+        self._show_clipboard_message(platform_name)
     
     def _show_clipboard_message(self, platform_name: str):
         """Show clipboard instruction message"""
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Information)
-        msg.setWindowTitle("Prompt Copied")
+        # Built once in __init__ and reused: only the one-line text
+        # changes per click, so the informative text keeps its layout
+        msg = self._clipboard_msg
         msg.setText(f"Opening {platform_name} in your browser...")
-        msg.setInformativeText("Your prompt has been copied to the clipboard. Paste it (Ctrl+V/Cmd+V) in the chat window.")
-        msg.setStandardButtons(QMessageBox.Ok)
-        msg.setDefaultButton(QMessageBox.Ok)
-        
+
         # Auto-close after 4 seconds
         QTimer.singleShot(4000, msg.close)
         msg.show()
-        
+
         self.status_bar.showMessage(f"Prompt copied and opening {platform_name}...", 3000)
     
     def copy_output(self):
@@ -918,8 +1301,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "No Output", "No output to copy")
             return
             
-        clipboard = QApplication.clipboard()
-        clipboard.setText(output_text)
+        self._copy_text(output_text)
         self.status_bar.showMessage("Output copied to clipboard", 2000)
     
     def run_prompt(self):
@@ -930,15 +1312,10 @@ class MainWindow(QMainWindow):
         
         # Get values from form
         self.current_values = self.placeholder_form.get_values()
-        
-        # Compose the prompt
-        schema = self.current_prompt.get_placeholders_schema()
-        result = prompt_composer.compose_prompt(
-            self.current_prompt.content,
-            self.current_values,
-            schema
-        )
-        
+
+        # Compose the prompt (or reuse the cached render)
+        result = self._get_rendered()
+
         if result['errors'] or result['missing_required']:
             error_msg = "Cannot run prompt:\n"
             if result['missing_required']:
@@ -972,35 +1349,47 @@ class MainWindow(QMainWindow):
         self.console.append_output("\n\nExecution stopped by user.")
     
     def update_models(self):
-        """Update model list when backend changes"""
+        """(Re)schedule a model refresh when the backend changes"""
+        self._model_load_timer.start()
+
+    def _do_update_models(self):
+        """Start a worker for the backend selected when the timer fired"""
         backend_name = self.backend_combo.currentText()
         if not backend_name:
             return
-            
+
         self.model_combo.clear()
         self.model_combo.addItem("Loading models...")
         self.model_combo.setEnabled(False)
-        
+
         # Create and start the worker thread
+        self._model_load_seq += 1
+        seq = self._model_load_seq
         self.model_worker = ModelLoadWorker(backend_name)
-        self.model_worker.models_loaded.connect(self.on_models_loaded)
-        self.model_worker.error_occurred.connect(self.on_model_load_error)
+        self.model_worker.models_loaded.connect(partial(self.on_models_loaded, seq))
+        self.model_worker.error_occurred.connect(partial(self.on_model_load_error, seq))
         self.model_worker.start()
-    
-    def on_models_loaded(self, models: List[str]):
+
+    def on_models_loaded(self, seq: int, models: List[str]):
         """Handle successful model loading"""
+        if seq != self._model_load_seq:
+            return  # superseded by a newer backend switch
+
         self.model_combo.clear()
         self.model_combo.setEnabled(True)
-        
+
         if models:
             self.model_combo.addItems(models)
             self.status_bar.showMessage(f"Loaded {len(models)} models", 2000)
         else:
             self.model_combo.addItem("No models available")
             self.status_bar.showMessage("No models found", 2000)
-    
-    def on_model_load_error(self, error_msg: str):
+
+    def on_model_load_error(self, seq: int, error_msg: str):
         """Handle model loading errors"""
+        if seq != self._model_load_seq:
+            return  # superseded by a newer backend switch
+
         self.model_combo.clear()
         self.model_combo.addItem("Failed to load models")
         self.model_combo.setEnabled(True)
@@ -1015,19 +1404,41 @@ class MainWindow(QMainWindow):
             "CSV Files (*.csv)"
         )
         
-        if file_path:
-            try:
-                stats = self.csv_importer.import_prompts(file_path, update_existing=False)
-                message = f"Import completed:\n"
-                message += f"Created: {stats['created']}\n"
-                message += f"Updated: {stats['updated']}\n"
-                message += f"Skipped: {stats['skipped']}\n"
-                message += f"Errors: {stats['errors']}"
-                
-                QMessageBox.information(self, "Import Results", message)
-                self.refresh_prompts()
-            except Exception as e:
-                QMessageBox.critical(self, "Import Error", f"Failed to import CSV: {str(e)}")
+        if not file_path:
+            return
+
+        # Parse + DB writes run in a worker thread; a modal progress
+        # dialog keeps the user informed without freezing the UI
+        progress_dialog = QProgressDialog("Importing prompts...", None, 0, 0, self)
+        progress_dialog.setWindowTitle("CSV Import")
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(500)
+
+        worker = CSVImportWorker(self.db_manager, file_path, update_existing=False)
+        worker.progress.connect(
+            lambda count: progress_dialog.setLabelText(f"Importing prompts... {count} rows")
+        )
+        worker.finished_stats.connect(partial(self._on_import_finished, progress_dialog))
+        worker.error_occurred.connect(partial(self._on_import_error, progress_dialog))
+        self._csv_import_worker = worker  # keep the thread alive
+        worker.start()
+
+    def _on_import_finished(self, progress_dialog, stats: Dict[str, int]):
+        """Show import results and refresh once the worker is done"""
+        progress_dialog.close()
+        message = f"Import completed:\n"
+        message += f"Created: {stats['created']}\n"
+        message += f"Updated: {stats['updated']}\n"
+        message += f"Skipped: {stats['skipped']}\n"
+        message += f"Errors: {stats['errors']}"
+
+        QMessageBox.information(self, "Import Results", message)
+        self.refresh_prompts()
+
+    def _on_import_error(self, progress_dialog, error_msg: str):
+        """Surface a failed import"""
+        progress_dialog.close()
+        QMessageBox.critical(self, "Import Error", f"Failed to import CSV: {error_msg}")
     
     def export_prompts(self):
         """Export selected prompts"""
@@ -1061,13 +1472,14 @@ class MainWindow(QMainWindow):
         <p><b>License:</b> MIT License</p>
         <p><b>Built with:</b> Python, PySide6, SQLModel</p>
         """
-        
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Information)
-        msg.setWindowTitle("About Prompt Studio")
-        msg.setText(about_text)
-        msg.setStandardButtons(QMessageBox.Ok)
-        msg.exec()
+
+        # Built lazily, then reused so the HTML is laid out only once
+        if self._about_msg is None:
+            self._about_msg = QMessageBox(
+                QMessageBox.Information, "About Prompt Studio",
+                about_text, QMessageBox.Ok, self
+            )
+        self._about_msg.exec()
     
     def show_credits(self):
         """Show Credits dialog"""
@@ -1094,13 +1506,13 @@ class MainWindow(QMainWindow):
         <p><b>License Compatibility:</b> MIT License (application code) + CC0-1.0 (sample data)<br>
         This combination ensures free use, modification, and distribution.</p>
         """
-        
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Information)
-        msg.setWindowTitle("Credits - Prompt Studio")
-        msg.setText(credits_text)
-        msg.setStandardButtons(QMessageBox.Ok)
-        msg.exec()
+
+        if self._credits_msg is None:
+            self._credits_msg = QMessageBox(
+                QMessageBox.Information, "Credits - Prompt Studio",
+                credits_text, QMessageBox.Ok, self
+            )
+        self._credits_msg.exec()
     
     def closeEvent(self, event):
         """Handle application close"""
@@ -7,9 +7,10 @@ https://huggingface.co/datasets/fka/awesome-chatgpt-prompts
 """
 import csv
 import json
-from typing import List, Dict, Optional
-from datetime import datetime
-from sqlmodel import Session, select
+import uuid
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+from sqlmodel import select
 
 from ..models.database import Prompt, Tag, PromptTagLink, DatabaseManager
 
@@ -20,193 +21,321 @@ class CSVImporter:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         
-    def parse_csv(self, file_path: str) -> List[Dict]:
-        """Parse CSV file and return list of prompt dictionaries"""
-        prompts = []
-        
+    def parse_csv(self, file_path: str) -> Iterator[Dict]:
+        """Parse a CSV file, yielding mapped prompt dictionaries per row
+
+        Streaming keeps memory at O(1) instead of materializing the whole
+        file; callers that need only a few rows (preview) stop early.
+        """
         with open(file_path, 'r', encoding='utf-8') as file:
-            # Use csv.Sniffer to detect delimiter
-            sample = file.read(1024)
-            file.seek(0)
-            sniffer = csv.Sniffer()
-            delimiter = sniffer.sniff(sample).delimiter
-            
-            reader = csv.DictReader(file, delimiter=delimiter)
-            
+            # Detect the delimiter from the header line: whichever common
+            # separator occurs most often wins. Cheaper and more
+            # predictable than csv.Sniffer; fall back to Sniffer only if
+            # the header contains none of them
+            header_line = file.readline()
+            delimiter = max(',;\t|', key=header_line.count)
+            if header_line.count(delimiter) == 0:
+                try:
+                    delimiter = csv.Sniffer().sniff(header_line).delimiter
+                except csv.Error:
+                    delimiter = ','
+
+            # The header is already consumed, so parse it here and hand
+            # the field names to DictReader — no seek(0), the file is
+            # read in one sequential pass
+            fieldnames = next(csv.reader([header_line], delimiter=delimiter))
+            reader = csv.DictReader(file, fieldnames=fieldnames, delimiter=delimiter)
+
+            # Headers are constant across rows: resolve the column roles
+            # once instead of scanning row.keys() per row
+            col_map = self._build_column_map(reader.fieldnames)
+
             for row in reader:
                 # Map CSV columns to our expected format
-                prompt_data = self._map_csv_row(row)
+                prompt_data = self._map_csv_row(row, col_map)
                 if prompt_data:
-                    prompts.append(prompt_data)
-                    
-        return prompts
-    
-    def _map_csv_row(self, row: Dict[str, str]) -> Optional[Dict]:
-        """Map CSV row to prompt dictionary with flexible column mapping"""
-        # Try to find required columns with flexible naming
-        name = None
-        content = None
-        
-        # Look for name column
-        for key in row.keys():
-            if key.lower() in ['name', 'title', 'act', 'role']:
-                name = row[key].strip()
-                break
-                
-        # Look for content column
-        for key in row.keys():
-            if key.lower() in ['content', 'prompt', 'description', 'text']:
-                content = row[key].strip()
-                break
-                
+                    yield prompt_data
+
+    def iter_prompts(self, file_path: str) -> Iterator[Dict]:
+        """Yield mapped prompt dictionaries from a CSV file one row at a time"""
+        return self.parse_csv(file_path)
+
+    @staticmethod
+    def _build_column_map(fieldnames: Optional[List[str]]) -> Dict[str, Optional[str]]:
+        """Resolve header names to column roles with flexible naming
+
+        Computed once per file so mapping each row is plain dict lookups.
+        """
+        # One .lower() per header, then candidate resolution is dict lookups
+        lower_map = {field.lower(): field for field in reversed(fieldnames or [])}
+
+        def first_match(candidates, exclude=None):
+            return next(
+                (lower_map[c] for c in candidates
+                 if c in lower_map and lower_map[c] != exclude),
+                None
+            )
+
+        col_map = {
+            'name': first_match(('name', 'title', 'act', 'role')),
+            'content': first_match(('content', 'prompt', 'description', 'text')),
+            'category': first_match(('category',)),
+            'tags': first_match(('tags', 'tag')),
+            'schema': first_match(('placeholders_schema', 'schema', 'placeholders')),
+        }
+        # The content column may have claimed 'description'; don't reuse it
+        col_map['description'] = first_match(('description', 'desc'), exclude=col_map['content'])
+        return col_map
+
+    @staticmethod
+    def _cell(row: Dict[str, str], col_map: Dict[str, Optional[str]], role: str) -> str:
+        """Stripped cell text for a column role, or '' if absent"""
+        column = col_map.get(role)
+        value = row.get(column) if column else None
+        return value.strip() if value else ""
+
+    def _map_csv_row(self, row: Dict[str, str], col_map: Dict[str, Optional[str]]) -> Optional[Dict]:
+        """Map CSV row to prompt dictionary using the precomputed columns"""
+        name = self._cell(row, col_map, 'name')
+        content = self._cell(row, col_map, 'content')
+
         if not name or not content:
             return None
-            
-        # Extract other fields with flexible mapping
-        category = None
-        tags_str = ""
-        description = None
+
+        tags_str = self._cell(row, col_map, 'tags')
+        tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()] if tags_str else []
+
         placeholders_schema = None
-        
-        for key, value in row.items():
-            key_lower = key.lower()
-            if key_lower == 'category':
-                category = value.strip() if value else None
-            elif key_lower in ['tags', 'tag']:
-                tags_str = value.strip() if value else ""
-            elif key_lower in ['description', 'desc'] and key.lower() != 'content':
-                description = value.strip() if value else None
-            elif key_lower in ['placeholders_schema', 'schema', 'placeholders']:
-                if value and value.strip():
-                    try:
-                        # Try to parse JSON schema
-                        placeholders_schema = json.loads(value.strip())
-                    except json.JSONDecodeError:
-                        # If not valid JSON, ignore
-                        pass
-        
-        # Parse tags
-        tags = []
-        if tags_str:
-            tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-            
+        schema_str = self._cell(row, col_map, 'schema')
+        if schema_str:
+            try:
+                # Try to parse JSON schema
+                placeholders_schema = json.loads(schema_str)
+            except json.JSONDecodeError:
+                # If not valid JSON, ignore
+                pass
+
         return {
             'name': name,
             'content': content,
-            'category': category,
+            'category': self._cell(row, col_map, 'category') or None,
             'tags': tags,
-            'description': description,
+            'description': self._cell(row, col_map, 'description') or None,
             'placeholders_schema': placeholders_schema
         }
     
-    def import_prompts(self, file_path: str, update_existing: bool = False) -> Dict[str, int]:
-        """Import prompts from CSV file
-        
+    PROGRESS_EVERY = 100  # rows between progress callbacks
+
+    def import_prompts(
+        self,
+        file_path: str,
+        update_existing: bool = False,
+        progress_callback=None
+    ) -> Dict[str, int]:
+        """Import prompts from CSV file with batched inserts
+
+        Existing prompt and tag names are preloaded into dicts with two
+        projected SELECTs, rows are collected into lists and written with
+        executemany statements, and the whole import commits once — no
+        per-row SELECT or flush.
+
         Args:
             file_path: Path to CSV file
             update_existing: Whether to update existing prompts or skip them
-            
+            progress_callback: Optional callable invoked with the running
+                row count every PROGRESS_EVERY rows
+
         Returns:
             Dictionary with counts of created, updated, and skipped prompts
         """
         stats = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
-        
+
         try:
-            prompt_data_list = self.parse_csv(file_path)
-            
             with self.db_manager.get_session() as session:
-                for prompt_data in prompt_data_list:
-                    try:
-                        result = self._import_single_prompt(session, prompt_data, update_existing)
-                        stats[result] += 1
-                    except Exception as e:
-                        print(f"Error importing prompt {prompt_data.get('name', 'Unknown')}: {e}")
-                        stats['errors'] += 1
-                        
+                existing_prompts = {
+                    name: prompt_id
+                    for prompt_id, name in session.exec(select(Prompt.id, Prompt.name))
+                }
+                tag_ids = {
+                    name: tag_id
+                    for tag_id, name in session.exec(select(Tag.id, Tag.name))
+                }
+                next_tag_id = max(tag_ids.values(), default=0) + 1
+
+                prompt_rows = []
+                update_rows = []
+                tag_rows = []
+                link_rows = []
+                refresh_link_ids = []  # updated prompts whose links get rebuilt
+
+                processed = 0
+                for prompt_data in self.iter_prompts(file_path):
+                    processed += 1
+                    if progress_callback and processed % self.PROGRESS_EVERY == 0:
+                        progress_callback(processed)
+
+                    name = prompt_data['name']
+                    prompt_id = existing_prompts.get(name)
+                    tags = prompt_data.get('tags', [])
+
+                    if prompt_id is not None:
+                        if not update_existing:
+                            stats['skipped'] += 1
+                            continue
+
+                        update_row = {
+                            'id': prompt_id,
+                            'content': prompt_data['content'],
+                            'description': prompt_data.get('description'),
+                            'category': prompt_data.get('category'),
+                        }
+                        if prompt_data.get('placeholders_schema'):
+                            update_row['placeholders_schema'] = prompt_data['placeholders_schema']
+                        update_rows.append(update_row)
+                        stats['updated'] += 1
+
+                        if tags:
+                            refresh_link_ids.append(prompt_id)
+                    else:
+                        # created_at/updated_at come from the server defaults
+                        prompt_id = str(uuid.uuid4())
+                        existing_prompts[name] = prompt_id
+                        prompt_rows.append({
+                            'id': prompt_id,
+                            'name': name,
+                            'content': prompt_data['content'],
+                            'description': prompt_data.get('description'),
+                            'category': prompt_data.get('category'),
+                            'placeholders_schema': prompt_data.get('placeholders_schema'),
+                            'is_favorite': False,
+                        })
+                        stats['created'] += 1
+
+                    for tag_name in tags:
+                        tag_name = tag_name.strip()
+                        if not tag_name:
+                            continue
+                        tag_id = tag_ids.get(tag_name)
+                        if tag_id is None:
+                            tag_id = tag_ids[tag_name] = next_tag_id
+                            next_tag_id += 1
+                            tag_rows.append({'id': tag_id, 'name': tag_name})
+                        link_rows.append({'prompt_id': prompt_id, 'tag_id': tag_id})
+
+                if prompt_rows:
+                    session.execute(Prompt.__table__.insert(), prompt_rows)
+                if update_rows:
+                    session.bulk_update_mappings(Prompt, update_rows)
+                if refresh_link_ids:
+                    session.execute(
+                        PromptTagLink.__table__.delete().where(
+                            PromptTagLink.__table__.c.prompt_id.in_(refresh_link_ids)
+                        )
+                    )
+                if tag_rows:
+                    session.execute(Tag.__table__.insert(), tag_rows)
+                if link_rows:
+                    session.execute(PromptTagLink.__table__.insert(), link_rows)
+
                 session.commit()
-                        
+
         except Exception as e:
             print(f"Error reading CSV file: {e}")
             stats['errors'] += 1
-            
+
         return stats
     
-    def _import_single_prompt(self, session: Session, prompt_data: Dict, update_existing: bool = False) -> str:
-        """Import a single prompt into the database"""
-        # Check if prompt already exists
-        existing_prompt = session.exec(
-            select(Prompt).where(Prompt.name == prompt_data['name'])
-        ).first()
-        
-        if existing_prompt:
-            if update_existing:
-                # Update existing prompt
-                existing_prompt.content = prompt_data['content']
-                existing_prompt.description = prompt_data.get('description')
-                existing_prompt.category = prompt_data.get('category')
-                existing_prompt.updated_at = datetime.utcnow()
-                
-                if prompt_data.get('placeholders_schema'):
-                    existing_prompt.set_placeholders_schema(prompt_data['placeholders_schema'])
-                
-                # Update tags
-                self._update_prompt_tags(session, existing_prompt, prompt_data.get('tags', []))
-                
-                return 'updated'
-            else:
-                return 'skipped'
-        else:
-            # Create new prompt
-            new_prompt = Prompt(
-                name=prompt_data['name'],
-                content=prompt_data['content'],
-                description=prompt_data.get('description'),
-                category=prompt_data.get('category')
-            )
-            
-            if prompt_data.get('placeholders_schema'):
-                new_prompt.set_placeholders_schema(prompt_data['placeholders_schema'])
-                
-            session.add(new_prompt)
-            session.flush()  # Flush to get the ID
-            
-            # Add tags
-            self._update_prompt_tags(session, new_prompt, prompt_data.get('tags', []))
-            
-            return 'created'
-    
-    def _update_prompt_tags(self, session: Session, prompt: Prompt, tag_names: List[str]):
-        """Update tags for a prompt"""
-        if not tag_names:
-            return
-            
-        # Remove existing tags
-        session.exec(
-            select(PromptTagLink).where(PromptTagLink.prompt_id == prompt.id)
-        ).all()
-        for link in session.exec(select(PromptTagLink).where(PromptTagLink.prompt_id == prompt.id)):
-            session.delete(link)
-        
-        # Add new tags
-        for tag_name in tag_names:
-            tag_name = tag_name.strip()
-            if not tag_name:
-                continue
-                
-            # Find or create tag
-            existing_tag = session.exec(
-                select(Tag).where(Tag.name == tag_name)
-            ).first()
-            
-            if not existing_tag:
-                existing_tag = Tag(name=tag_name)
-                session.add(existing_tag)
-                session.flush()  # Flush to get the ID
-            
-            # Create link
-            link = PromptTagLink(prompt_id=prompt.id, tag_id=existing_tag.id)
-            session.add(link)
-    
+    def bulk_import(self, rows: Iterable[Dict], chunk_size: int = 1000) -> Dict[str, int]:
+        """Fast-path import using core-level executemany inserts
+
+        Intended for the initial import into a fresh database: rows are
+        collected into chunks and inserted with one prepared statement
+        per chunk inside a single transaction, bypassing per-row ORM
+        bookkeeping. Duplicate names within the input are skipped in
+        Python; INSERT OR IGNORE lets the unique index on name absorb
+        any clash with existing database rows without a SELECT.
+
+        Args:
+            rows: Iterable of mapped prompt dictionaries
+            chunk_size: Rows per executemany batch
+
+        Returns:
+            Dictionary with counts of created, updated, and skipped prompts
+        """
+        stats = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
+
+        prompt_rows = []
+        tag_ids: Dict[str, int] = {}
+        tag_rows = []
+        link_rows = []
+        seen_names = set()
+
+        try:
+            with self.db_manager.get_session() as session:
+                for tag_id, tag_name in session.exec(select(Tag.id, Tag.name)):
+                    tag_ids[tag_name] = tag_id
+            next_tag_id = max(tag_ids.values(), default=0) + 1
+
+            for prompt_data in rows:
+                name = prompt_data['name']
+                if name in seen_names:
+                    stats['skipped'] += 1
+                    continue
+                seen_names.add(name)
+
+                # created_at/updated_at come from the server-side default
+                prompt_id = str(uuid.uuid4())
+                prompt_rows.append({
+                    'id': prompt_id,
+                    'name': name,
+                    'content': prompt_data['content'],
+                    'description': prompt_data.get('description'),
+                    'category': prompt_data.get('category'),
+                    'placeholders_schema': prompt_data.get('placeholders_schema'),
+                    'is_favorite': False,
+                })
+                stats['created'] += 1
+
+                for tag_name in prompt_data.get('tags', []):
+                    tag_id = tag_ids.get(tag_name)
+                    if tag_id is None:
+                        tag_id = tag_ids[tag_name] = next_tag_id
+                        next_tag_id += 1
+                        tag_rows.append({'id': tag_id, 'name': tag_name})
+                    link_rows.append({'prompt_id': prompt_id, 'tag_id': tag_id})
+
+            with self.db_manager.engine.begin() as conn:
+                # One big transaction; skip the per-commit fsync while it runs.
+                # OR IGNORE makes the unique indexes drop rows that already
+                # exist (database-side dedup, no SELECT round-trips)
+                conn.exec_driver_sql("PRAGMA synchronous=OFF")
+                try:
+                    prompt_insert = Prompt.__table__.insert().prefix_with("OR IGNORE")
+                    for start in range(0, len(prompt_rows), chunk_size):
+                        conn.execute(
+                            prompt_insert,
+                            prompt_rows[start:start + chunk_size]
+                        )
+                    if tag_rows:
+                        conn.execute(
+                            Tag.__table__.insert().prefix_with("OR IGNORE"),
+                            tag_rows
+                        )
+                    link_insert = PromptTagLink.__table__.insert().prefix_with("OR IGNORE")
+                    for start in range(0, len(link_rows), chunk_size):
+                        conn.execute(
+                            link_insert,
+                            link_rows[start:start + chunk_size]
+                        )
+                finally:
+                    conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+
+        except Exception as e:
+            print(f"Error during bulk import: {e}")
+            stats['errors'] += 1
+
+        return stats
+
     def preview_import(self, file_path: str, max_rows: int = 10) -> Dict:
         """Preview the first few rows of CSV import
         
@@ -218,42 +347,28 @@ class CSVImporter:
             Dictionary with preview data and column mapping info
         """
         try:
-            prompt_data_list = self.parse_csv(file_path)
-            
+            rows = self.parse_csv(file_path)
+            preview_rows = list(islice(rows, max_rows))
+            # Every yielded row has name and content; count the rest of
+            # the stream without retaining it
+            total_rows = len(preview_rows) + sum(1 for _ in rows)
+
             preview_data = {
-                'total_rows': len(prompt_data_list),
-                'preview_rows': prompt_data_list[:max_rows],
+                'total_rows': total_rows,
+                'preview_rows': preview_rows,
                 'columns_found': [],
-                'valid_prompts': 0
+                'valid_prompts': total_rows
             }
-            
-            # Count valid prompts
-            valid_count = 0
-            for prompt_data in prompt_data_list:
-                if prompt_data and prompt_data.get('name') and prompt_data.get('content'):
-                    valid_count += 1
-                    
-            preview_data['valid_prompts'] = valid_count
-            
-            # Identify columns found
-            if prompt_data_list:
-                sample_prompt = prompt_data_list[0]
-                columns = []
-                if sample_prompt.get('name'):
-                    columns.append('name')
-                if sample_prompt.get('content'):
-                    columns.append('content')
-                if sample_prompt.get('category'):
-                    columns.append('category')
-                if sample_prompt.get('tags'):
-                    columns.append('tags')
-                if sample_prompt.get('description'):
-                    columns.append('description')
-                if sample_prompt.get('placeholders_schema'):
-                    columns.append('placeholders_schema')
-                    
-                preview_data['columns_found'] = columns
-                
+
+            # Identify columns found across the previewed rows (not just
+            # the first one, which may leave optional fields blank)
+            preview_data['columns_found'] = [
+                column
+                for column in ('name', 'content', 'category', 'tags',
+                               'description', 'placeholders_schema')
+                if any(row.get(column) for row in preview_rows)
+            ]
+
             return preview_data
             
         except Exception as e:
@@ -1,89 +1,296 @@
 """
 Templating system for Prompt Studio using Jinja2
 """
-import re
+import asyncio
+import hashlib
+import os
 import json
+from collections import ChainMap
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import jinja2
-from jinja2.sandbox import SandboxedEnvironment
+import jinja2.meta
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+
+# Names injected by _enhance_context plus common Jinja globals; these are
+# never user-facing placeholders
+_TEMPLATE_BUILTINS = frozenset({'now', 'user', 'app', 'range', 'dict', 'list'})
+
+
+# Fallback defaults per scalar field type (choice types are handled
+# separately since their default depends on the options list)
+_TYPE_DEFAULTS = {"str": "", "text": "", "int": 0, "float": 0.0, "bool": False}
+
+# Template dict for auto-generated schema fields; callers overlay the
+# per-placeholder name and description via {**_DEFAULT_FIELD, ...}
+_DEFAULT_FIELD = {
+    "name": "",
+    "type": "str",
+    "required": True,
+    "default": "",
+    "description": ""
+}
+
+
+def _default_filter(value, default=""):
+    """Custom default filter that handles None and empty strings"""
+    if value is None or value == "":
+        return default
+    return value
+
+
+# Persist generated template bytecode alongside the database (the app
+# keeps its data working-directory-relative, like prompt_studio.db), so
+# re-launches skip Jinja's parse+compile for templates seen before.
+# Invalidation is automatic via Jinja's source checksum
+_BYTECODE_CACHE_DIR = ".jinja_cache"
+try:
+    os.makedirs(_BYTECODE_CACHE_DIR, exist_ok=True)
+    _BYTECODE_CACHE = jinja2.FileSystemBytecodeCache(directory=_BYTECODE_CACHE_DIR)
+except OSError:
+    _BYTECODE_CACHE = None
+
+class _LazyNow:
+    """Stand-in for datetime.now() that only takes the time if used
+
+    Most templates never reference {{ now }}, so the context carries
+    this proxy instead of a real timestamp; attribute access, str() and
+    format() resolve (and pin) the datetime on first use.
+    """
+    __slots__ = ('_value',)
+
+    def __init__(self):
+        self._value = None
+
+    def _resolve(self) -> datetime:
+        if self._value is None:
+            self._value = datetime.now()
+        return self._value
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __str__(self):
+        return str(self._resolve())
+
+    def __format__(self, format_spec):
+        return format(self._resolve(), format_spec)
+
+
+# One shared sandboxed environment: Jinja environments are expensive to
+# build and designed to be shared, so every TemplateEngine reuses this
+# one (and with it the compiled-template caches)
+_ENV = ImmutableSandboxedEnvironment(
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    cache_size=1000,
+    auto_reload=False,
+    bytecode_cache=_BYTECODE_CACHE
+)
+_ENV.filters['default'] = _default_filter
 
 
 class TemplateEngine:
     """Jinja2-based template engine for prompt rendering"""
     
+    # Distinct template strings cached; prompt libraries are far smaller
+    # than this in practice
+    TEMPLATE_CACHE_SIZE = 256
+
+    # Class-level and therefore shared: every engine uses the same _ENV,
+    # so compiled templates (keyed by source string; repeat renders skip
+    # Jinja's parse+compile front end) and extraction results are valid
+    # across instances
+    _template_cache: Dict[str, jinja2.Template] = {}
+    _placeholder_cache: Dict[str, List[str]] = {}
+
     def __init__(self):
-        self.env = SandboxedEnvironment(
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True
+        self.env = _ENV
+
+    def _load_code(self, template_str: str, source=None):
+        """Code object for a template, through the bytecode cache if set
+
+        Jinja only consults bytecode_cache on the loader path, which
+        from_string() and env.compile() bypass — so this does the
+        loader's bucket dance itself, keyed by content hash. Warm starts
+        then deserialize the stored code instead of re-running
+        parse+compile. `source` may be an already-parsed AST.
+        """
+        if source is None:
+            source = template_str
+        if _BYTECODE_CACHE is None:
+            return self.env.compile(source)
+
+        bucket = _BYTECODE_CACHE.get_bucket(
+            self.env,
+            hashlib.sha1(template_str.encode('utf-8')).hexdigest(),
+            None,
+            template_str,
         )
-        
-        # Add custom filters
-        self.env.filters['default'] = self._default_filter
-        
-    def _default_filter(self, value, default=""):
-        """Custom default filter that handles None and empty strings"""
-        if value is None or value == "":
-            return default
-        return value
-    
+        if bucket.code is None:
+            bucket.code = self.env.compile(source)
+            _BYTECODE_CACHE.set_bucket(bucket)
+        return bucket.code
+
+    def _compile(self, template_str: str) -> "jinja2.Template":
+        """Compiled Template for a source string, cached by content"""
+        template = self._template_cache.get(template_str)
+        if template is None:
+            if len(self._template_cache) >= self.TEMPLATE_CACHE_SIZE:
+                self._template_cache.clear()
+            template = self._template_cache[template_str] = self.env.template_class.from_code(
+                self.env,
+                self._load_code(template_str),
+                self.env.make_globals(None)
+            )
+        return template
+
+    def prepare(self, template_str: str):
+        """Compiled template plus placeholder list in one front-end pass
+
+        On cache misses the template is parsed once and the same AST
+        serves both extraction and compilation, instead of each side
+        re-parsing the source. Returns (template, placeholders); the
+        template is None when the source doesn't parse, in which case
+        rendering it will surface the error string as usual.
+        """
+        template = self._template_cache.get(template_str)
+        placeholders = self._placeholder_cache.get(template_str)
+        if template is not None and placeholders is not None:
+            return template, placeholders
+
+        try:
+            ast = self.env.parse(template_str)
+        except jinja2.TemplateSyntaxError:
+            return None, self.extract_placeholders(template_str)
+
+        if placeholders is None:
+            placeholders = sorted(
+                jinja2.meta.find_undeclared_variables(ast) - _TEMPLATE_BUILTINS
+            )
+            if len(self._placeholder_cache) >= self.TEMPLATE_CACHE_SIZE:
+                self._placeholder_cache.clear()
+            self._placeholder_cache[template_str] = placeholders
+
+        if template is None:
+            template = self.env.template_class.from_code(
+                self.env,
+                self._load_code(template_str, ast),
+                self.env.make_globals(None)
+            )
+            if len(self._template_cache) >= self.TEMPLATE_CACHE_SIZE:
+                self._template_cache.clear()
+            self._template_cache[template_str] = template
+
+        return template, placeholders
+
+    def render_compiled(self, template: "jinja2.Template", context: Dict[str, Any]) -> str:
+        """Render an already-compiled template with the enhanced context"""
+        try:
+            return template.render(self._enhance_context(context))
+        except jinja2.TemplateError as e:
+            return f"Template Error: {str(e)}"
+
+
     def render_template(self, template_str: str, context: Dict[str, Any]) -> str:
         """Render a template with given context"""
         try:
             # Add metadata to context
             enhanced_context = self._enhance_context(context)
             
-            template = self.env.from_string(template_str)
-            return template.render(**enhanced_context)
-        except Exception as e:
+            template = self._compile(template_str)
+            # Positional mapping: Jinja accepts any Mapping here, so the
+            # ChainMap is consumed without ** flattening it first
+            return template.render(enhanced_context)
+        except jinja2.TemplateError as e:
             return f"Template Error: {str(e)}"
     
-    def _enhance_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Add metadata and utility variables to context"""
-        enhanced = context.copy()
-        
-        # Add metadata
-        enhanced.update({
-            'now': datetime.now(),
-            'user': 'User',  # Could be customized in settings
-            'app': 'Prompt Studio'
-        })
-        
-        return enhanced
+    def _enhance_context(self, context: Dict[str, Any]) -> "ChainMap":
+        """Overlay metadata and utility variables without copying context
+
+        The ChainMap puts the three metadata keys in front of the user
+        context — same precedence as the old copy+update, minus the O(n)
+        dict copy per render.
+        """
+        return ChainMap(
+            {
+                'now': _LazyNow(),
+                'user': 'User',  # Could be customized in settings
+                'app': 'Prompt Studio'
+            },
+            context
+        )
     
     def extract_placeholders(self, template_str: str) -> List[str]:
-        """Extract all placeholder variables from a template"""
+        """Extract all placeholder variables from a template (cached)"""
+        # No expression or control delimiters means no placeholders:
+        # reject plain text before touching the cache or the parser
+        if '{{' not in template_str and '{%' not in template_str:
+            return []
+
+        placeholders = self._placeholder_cache.get(template_str)
+        if placeholders is None:
+            if len(self._placeholder_cache) >= self.TEMPLATE_CACHE_SIZE:
+                self._placeholder_cache.clear()
+            placeholders = self._placeholder_cache[template_str] = \
+                self._extract_placeholders(template_str)
+        return placeholders
+
+    def _extract_placeholders(self, template_str: str) -> List[str]:
+        """Extract placeholder variables from a template"""
+        # Fast path: no control or comment blocks means the template is
+        # plain text with {{ name }} expressions, which the scanner
+        # handles without invoking Jinja at all
+        if '{%' not in template_str and '{#' not in template_str:
+            scanned = self._extract_placeholders_scan(template_str, strict=True)
+            if scanned is not None:
+                return scanned
+
         try:
-            template = self.env.from_string(template_str)
-            undeclared_vars = jinja2.meta.find_undeclared_variables(template.environment.parse(template_str))
-            
-            # Filter out built-in variables
-            builtins = {'now', 'user', 'app', 'range', 'dict', 'list'}
-            placeholders = [var for var in undeclared_vars if var not in builtins]
-            
-            return sorted(list(set(placeholders)))
-        except Exception:
-            # Fallback to regex if Jinja2 parsing fails
-            return self._extract_placeholders_regex(template_str)
-    
-    def _extract_placeholders_regex(self, template_str: str) -> List[str]:
-        """Fallback regex-based placeholder extraction"""
-        # Find {{ variable }} patterns
-        pattern = r'\{\{\s*(\w+)(?:\s*\|\s*\w+)?\s*\}\}'
-        matches = re.findall(pattern, template_str)
-        
-        # Filter out common Jinja2 built-ins
-        builtins = {'now', 'user', 'app', 'range', 'dict', 'list'}
-        placeholders = [match for match in matches if match not in builtins]
-        
-        return sorted(list(set(placeholders)))
+            undeclared_vars = jinja2.meta.find_undeclared_variables(self.env.parse(template_str))
+            return sorted(undeclared_vars - _TEMPLATE_BUILTINS)
+        except (jinja2.TemplateSyntaxError, TypeError):
+            # Fallback to the lenient scan if Jinja2 parsing fails
+            return self._extract_placeholders_scan(template_str)
+
+    @staticmethod
+    def _extract_placeholders_scan(
+        template_str: str,
+        strict: bool = False
+    ) -> Optional[List[str]]:
+        """Single-pass scan for {{ name }} expressions, no regex involved
+
+        Drops an optional |filter and reduces dotted access to its root
+        variable, matching what find_undeclared_variables would report.
+        In strict mode, anything fancier returns None so the caller can
+        fall back to the real parser; otherwise it is skipped.
+        """
+        names = set()
+        find = template_str.find
+        i = 0
+        while True:
+            start = find('{{', i)
+            if start == -1:
+                break
+            end = find('}}', start + 2)
+            if end == -1:
+                break
+            i = end + 2
+
+            name = template_str[start + 2:end].split('|', 1)[0].strip()
+            root = name.split('.', 1)[0]
+            if root.isidentifier():
+                names.add(root)
+            elif strict:
+                return None
+        return sorted(names - _TEMPLATE_BUILTINS)
 
 
 class PlaceholderSchema:
     """Manages placeholder schemas for prompts"""
     
-    SUPPORTED_TYPES = [
+    SUPPORTED_TYPES = frozenset({
         "str",      # Short string input
         "text",     # Long text input (textarea)
         "int",      # Integer input
@@ -91,21 +298,18 @@ class PlaceholderSchema:
         "bool",     # Boolean checkbox
         "choice",   # Single choice dropdown
         "multichoice"  # Multiple choice checkboxes
-    ]
+    })
+
+    # Types that require a non-empty 'options' list
+    CHOICE_TYPES = frozenset({"choice", "multichoice"})
     
     @staticmethod
     def create_schema_from_placeholders(placeholders: List[str]) -> List[Dict[str, Any]]:
         """Create a basic schema from placeholder names"""
-        schema = []
-        for placeholder in placeholders:
-            schema.append({
-                "name": placeholder,
-                "type": "str",
-                "required": True,
-                "default": "",
-                "description": f"Value for {placeholder}"
-            })
-        return schema
+        return [
+            {**_DEFAULT_FIELD, "name": p, "description": f"Value for {p}"}
+            for p in placeholders
+        ]
     
     @staticmethod
     def validate_schema(schema: List[Dict[str, Any]]) -> List[str]:
@@ -116,40 +320,45 @@ class PlaceholderSchema:
             errors.append("Schema must be a list")
             return errors
         
+        # Local bindings keep the per-field work tight: one pass, O(1)
+        # frozenset membership checks, no repeated attribute lookups
+        append_error = errors.append
+        supported_types = PlaceholderSchema.SUPPORTED_TYPES
+        choice_types = PlaceholderSchema.CHOICE_TYPES
         seen_names = set()
-        
+
         for i, field in enumerate(schema):
             if not isinstance(field, dict):
-                errors.append(f"Field {i} must be a dictionary")
+                append_error(f"Field {i} must be a dictionary")
                 continue
-                
+
             # Check required fields
-            if "name" not in field:
-                errors.append(f"Field {i} missing required 'name' field")
+            name = field.get("name")
+            if name is None:
+                append_error(f"Field {i} missing required 'name' field")
                 continue
-                
-            name = field["name"]
-            
+
             # Check for duplicate names
             if name in seen_names:
-                errors.append(f"Duplicate field name: {name}")
-            seen_names.add(name)
-            
+                append_error(f"Duplicate field name: {name}")
+            else:
+                seen_names.add(name)
+
             # Validate name format
-            if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name):
-                errors.append(f"Invalid field name '{name}': must be a valid identifier")
-            
+            if not name.isidentifier():
+                append_error(f"Invalid field name '{name}': must be a valid identifier")
+
             # Check type
             field_type = field.get("type", "str")
-            if field_type not in PlaceholderSchema.SUPPORTED_TYPES:
-                errors.append(f"Unsupported type '{field_type}' for field '{name}'")
-            
+            if field_type not in supported_types:
+                append_error(f"Unsupported type '{field_type}' for field '{name}'")
+
             # Validate choice options
-            if field_type in ["choice", "multichoice"]:
+            if field_type in choice_types:
                 options = field.get("options", [])
                 if not isinstance(options, list) or not options:
-                    errors.append(f"Field '{name}' with type '{field_type}' must have non-empty 'options' list")
-        
+                    append_error(f"Field '{name}' with type '{field_type}' must have non-empty 'options' list")
+
         return errors
     
     @staticmethod
@@ -160,24 +369,14 @@ class PlaceholderSchema:
         """Merge existing schema with new placeholders found in template"""
         # Create mapping of existing schema fields
         existing_fields = {field["name"]: field for field in existing_schema}
-        
-        merged_schema = []
-        
-        # Add existing fields that are still in placeholders
-        for placeholder in placeholders:
-            if placeholder in existing_fields:
-                merged_schema.append(existing_fields[placeholder])
-            else:
-                # Add new placeholder with default config
-                merged_schema.append({
-                    "name": placeholder,
-                    "type": "str",
-                    "required": True,
-                    "default": "",
-                    "description": f"Value for {placeholder}"
-                })
-        
-        return merged_schema
+
+        # Keep existing fields still present in the template; new
+        # placeholders get a copy of the default config
+        return [
+            existing_fields.get(p)
+            or {**_DEFAULT_FIELD, "name": p, "description": f"Value for {p}"}
+            for p in placeholders
+        ]
 
 
 class PromptComposer:
@@ -202,11 +401,18 @@ class PromptComposer:
             'errors': [],
             'missing_required': []
         }
-        
+
+        # Plain text with no Jinja syntax renders to itself; skip the
+        # template machinery entirely (unless a schema still needs to
+        # validate the provided values)
+        if not schema and '{{' not in template and '{%' not in template and '{#' not in template:
+            result['rendered'] = template
+            return result
+
         try:
-            # Extract placeholders from template
-            placeholders = self.template_engine.extract_placeholders(template)
-            
+            # One front-end pass: compiled template and placeholders
+            compiled, placeholders = self.template_engine.prepare(template)
+
             # If schema is provided, validate values against it
             if schema:
                 validation_result = self._validate_values_against_schema(values, schema)
@@ -223,14 +429,96 @@ class PromptComposer:
                     result['missing_required'] = missing
                     return result
             
-            # Render the template
-            result['rendered'] = self.template_engine.render_template(template, values)
+            # Render the template (render_template reports the syntax
+            # error when the source didn't compile)
+            if compiled is not None:
+                result['rendered'] = self.template_engine.render_compiled(compiled, values)
+            else:
+                result['rendered'] = self.template_engine.render_template(template, values)
             
         except Exception as e:
             result['errors'].append(str(e))
         
         return result
     
+    def compose_prompts(
+        self,
+        template: str,
+        values_list: List[Dict[str, Any]],
+        schema: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Compose one template against many value sets
+
+        The template front end (parse, extraction, compile) runs once;
+        each value set then pays only validation and the render itself.
+
+        Returns:
+            One result dict per value set, in input order, each with
+            'rendered', 'errors', and 'missing_required' keys
+        """
+        compiled, placeholders = self.template_engine.prepare(template)
+
+        return [
+            self._compose_one(compiled, template, placeholders, values, schema)
+            for values in values_list
+        ]
+
+    async def compose_prompts_async(
+        self,
+        template: str,
+        values_list: List[Dict[str, Any]],
+        schema: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of compose_prompts fanning items out to threads
+
+        Useful when batch composition feeds concurrent LLM calls: each
+        validation+render runs in the default executor and results are
+        gathered in input order.
+        """
+        compiled, placeholders = self.template_engine.prepare(template)
+
+        return list(await asyncio.gather(*(
+            asyncio.to_thread(
+                self._compose_one, compiled, template, placeholders, values, schema
+            )
+            for values in values_list
+        )))
+
+    def _compose_one(
+        self,
+        compiled,
+        template: str,
+        placeholders: List[str],
+        values: Dict[str, Any],
+        schema: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Validate and render a single value set against a prepared template"""
+        result = {
+            'rendered': '',
+            'errors': [],
+            'missing_required': []
+        }
+
+        try:
+            if schema:
+                validation_result = self._validate_values_against_schema(values, schema)
+                result['errors'].extend(validation_result['errors'])
+                result['missing_required'].extend(validation_result['missing_required'])
+            else:
+                result['missing_required'] = [
+                    p for p in placeholders if values.get(p) is None
+                ]
+
+            if not result['missing_required']:
+                if compiled is not None:
+                    result['rendered'] = self.template_engine.render_compiled(compiled, values)
+                else:
+                    result['rendered'] = self.template_engine.render_template(template, values)
+        except Exception as e:
+            result['errors'].append(str(e))
+
+        return result
+
     def _validate_values_against_schema(
         self, 
         values: Dict[str, Any], 
@@ -274,7 +562,10 @@ class PromptComposer:
                 elif field_type == "multichoice":
                     options = field.get("options", [])
                     if isinstance(value, list):
-                        invalid_choices = [v for v in value if v not in options]
+                        # Membership against a set: O(n+m) instead of a
+                        # list scan per selected value
+                        opt_set = frozenset(options)
+                        invalid_choices = [v for v in value if v not in opt_set]
                         if invalid_choices:
                             errors.append(f"Invalid choices for '{name}': {invalid_choices}. Options: {options}")
                     else:
@@ -290,31 +581,29 @@ class PromptComposer:
     def get_default_values(self, schema: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Get default values from schema"""
         defaults = {}
-        
+        choice_types = PlaceholderSchema.CHOICE_TYPES
+
         for field in schema:
+            field_get = field.get
             name = field["name"]
-            default = field.get("default")
-            
+            default = field_get("default")
+
             if default is not None:
                 defaults[name] = default
-            else:
-                # Provide type-appropriate defaults
-                field_type = field.get("type", "str")
-                if field_type == "int":
-                    defaults[name] = 0
-                elif field_type == "float":
-                    defaults[name] = 0.0
-                elif field_type == "bool":
-                    defaults[name] = False
-                elif field_type in ["choice", "multichoice"]:
-                    options = field.get("options", [])
-                    if options:
-                        defaults[name] = options[0] if field_type == "choice" else [options[0]]
-                    else:
-                        defaults[name] = "" if field_type == "choice" else []
+                continue
+
+            # Type-appropriate defaults: one dict lookup for the scalar
+            # types; choice types depend on the options list
+            field_type = field_get("type", "str")
+            if field_type in choice_types:
+                options = field_get("options", [])
+                if options:
+                    defaults[name] = options[0] if field_type == "choice" else [options[0]]
                 else:
-                    defaults[name] = ""
-        
+                    defaults[name] = "" if field_type == "choice" else []
+            else:
+                defaults[name] = _TYPE_DEFAULTS.get(field_type, "")
+
         return defaults
 
 
@@ -5,8 +5,13 @@ Simple launcher script for Prompt Studio
 import subprocess
 import sys
 import os
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 
+# Checked via package metadata, not imported: importing PySide6 alone
+# costs hundreds of ms just to answer "is it installed?"
+REQUIRED_PACKAGES = ("PySide6", "sqlmodel", "jinja2", "httpx", "keyring", "orjson")
+
 def check_python_version():
     """Check if Python version is compatible"""
     if sys.version_info < (3, 11):
@@ -17,14 +22,11 @@ def check_python_version():
 def install_dependencies():
     """Install required dependencies if needed"""
     try:
-        import PySide6
-        import sqlmodel
-        import jinja2
-        import httpx
-        import keyring
+        for package in REQUIRED_PACKAGES:
+            distribution(package)
         print("All dependencies are already installed.")
         return True
-    except ImportError as e:
+    except PackageNotFoundError as e:
         print(f"Missing dependency: {e}")
         print("Installing dependencies...")
         